@@ -1,16 +1,27 @@
 """FastAPI application factory"""
 from contextlib import asynccontextmanager
+import importlib
 import logging
 import os
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
 from config import get_config
-from app.core.database import init_db
+from app.core.database import get_engine, get_session_local, init_db
+from app.core.docs import register_docs
 from app.logging_config import configure_logging
-from app.routes.academic_router import router as academic_router
-from app.routes.doctor_router import router as doctor_router
-from app.routes.insurance_router import router as insurance_router
-from app.routes.external_compliance import router as external_compliance_router
+
+# (module, prefix, tags) for each router; modules are imported by create_app
+# so that importing this package does not pull in every model and schema
+ROUTERS = (
+    ("app.routes.academic_router", "/api/v1/academic", ["Academic"]),
+    ("app.routes.doctor_router", "/api/v1/doctors", ["Doctor"]),
+    ("app.routes.insurance_router", "/api/v1/insurance", ["Insurance"]),
+    # Framework-specific compliance checks (PEP, GDPR, PCI, HIPAA, ISO 27001, market)
+    ("app.routes.compliance", "/compliance", ["Compliance"]),
+    # External Compliance & Verification API (base URL: /api)
+    ("app.routes.external_compliance", "/api", ["External Compliance"]),
+)
 
 def create_app(env: str = "development") -> FastAPI:
     """Create and configure FastAPI application"""
@@ -21,8 +32,13 @@ def create_app(env: str = "development") -> FastAPI:
     # Get configuration
     settings = get_config(env)
     
-    # Initialize database
-    init_db()
+    # Build the engine from this environment's settings (pool, URL) before
+    # anything falls back to the default config
+    get_engine(settings)
+    
+    # Initialize database (skipped when tables are managed by migrations)
+    if settings.AUTO_CREATE_TABLES:
+        init_db()
     
     # Create FastAPI app with lifespan context
     @asynccontextmanager
@@ -32,8 +48,17 @@ def create_app(env: str = "development") -> FastAPI:
         # Get port from environment variable (supports both PORT and UVICORN_PORT)
         port = int(os.getenv("PORT", os.getenv("UVICORN_PORT", 8001)))
         logger.info("Application startup")
-        logger.info(f"Swagger UI: http://localhost:{port}/docs")
-        logger.info(f"Redoc: http://localhost:{port}/redoc")
+        if settings.ENABLE_DOCS:
+            logger.info(f"Swagger UI: http://localhost:{port}/docs")
+            logger.info(f"Redoc: http://localhost:{port}/redoc")
+        # Rebuild the shared academic indexes (one worker per deploy); on
+        # failure or without Redis they fill on demand
+        from app.routes.academic_router import load_indexes
+        try:
+            with get_session_local()() as db:
+                load_indexes(db)
+        except Exception as e:
+            logger.warning(f"Academic index warm-up skipped: {e}")
         yield
         # Shutdown
         logger.info("Application shutdown")
@@ -42,7 +67,13 @@ def create_app(env: str = "development") -> FastAPI:
         title=settings.API_TITLE,
         version=settings.API_VERSION,
         description="FastAPI for doctor onboarding, academic admission, and insurance claim flows.",
-        lifespan=lifespan
+        lifespan=lifespan,
+        # orjson encodes datetimes natively and is several times faster than json
+        default_response_class=ORJSONResponse,
+        # Served by register_docs so the spec is serialized once, not per request
+        openapi_url=None,
+        docs_url=None,
+        redoc_url=None,
     )
     
     # Add CORS middleware
@@ -55,11 +86,9 @@ def create_app(env: str = "development") -> FastAPI:
     )
     
     # Include routers
-    app.include_router(academic_router, prefix="/api/v1/academic", tags=["Academic"])
-    app.include_router(doctor_router, prefix="/api/v1/doctors", tags=["Doctor"])
-    app.include_router(insurance_router, prefix="/api/v1/insurance", tags=["Insurance"])
-    # External Compliance & Verification API (base URL: /api)
-    app.include_router(external_compliance_router, prefix="/api", tags=["External Compliance"])
+    for module_name, prefix, tags in ROUTERS:
+        module = importlib.import_module(module_name)
+        app.include_router(module.router, prefix=prefix, tags=tags)
     
     # Health check endpoint
     @app.get("/api/v1/health", tags=["Health"])
@@ -76,4 +105,8 @@ def create_app(env: str = "development") -> FastAPI:
         """Return empty response for favicon requests"""
         return "", 204
     
+    # OpenAPI spec and interactive docs (off in production unless ENABLE_DOCS is set)
+    if settings.ENABLE_DOCS:
+        register_docs(app, debug=settings.DEBUG)
+    
     return app
@@ -0,0 +1,128 @@
+"""Background batched inserts for append-only records"""
+import atexit
+import logging
+import queue
+import threading
+import time
+
+from sqlalchemy import insert
+from sqlalchemy.exc import DBAPIError, OperationalError
+
+from app.core.database import get_session_local
+
+logger = logging.getLogger(__name__)
+
+# Queue sentinel telling the writer thread to flush and exit
+_STOP = object()
+
+# Seconds to wait before each retry of a batch that hit a connection or
+# server error; the batch is then written row by row
+RETRY_DELAYS = (0.1, 0.5, 2.0)
+
+
+def _is_transient(error: Exception) -> bool:
+    """Connection drops and server-side operational errors, not bad rows"""
+    return isinstance(error, OperationalError) or (
+        isinstance(error, DBAPIError) and error.connection_invalidated
+    )
+
+
+class BatchWriter:
+    """Queues row dicts for one model and inserts them from a background thread.
+
+    Rows are written with one multi-row Core INSERT + commit per batch of up
+    to `max_batch` rows, or whatever has arrived `max_wait` seconds after
+    the first row of a batch. A batch that hits a connection error is
+    retried after each of RETRY_DELAYS; if it still fails it is written
+    row by row, and only rows that fail on their own are logged and dropped.
+    Rows still queued at interpreter exit are flushed by an atexit hook.
+    """
+
+    def __init__(self, model, max_batch: int = 100, max_wait: float = 0.25):
+        self.model = model
+        # Core statement, so batches skip ORM mapping and unit-of-work overhead
+        self._insert = insert(model.__table__)
+        self.max_batch = max_batch
+        self.max_wait = max_wait
+        self._queue = queue.Queue()
+        self._thread = None
+        self._lock = threading.Lock()
+
+    def put(self, row: dict) -> None:
+        """Queue one row; returns immediately"""
+        if self._thread is None:
+            self._start()
+        self._queue.put_nowait(row)
+
+    def put_many(self, rows: list) -> None:
+        """Queue several rows; returns immediately"""
+        if self._thread is None:
+            self._start()
+        for row in rows:
+            self._queue.put_nowait(row)
+
+    def close(self) -> None:
+        """Flush everything queued and stop the writer thread"""
+        with self._lock:
+            thread, self._thread = self._thread, None
+        if thread is not None:
+            self._queue.put(_STOP)
+            thread.join()
+
+    def _start(self) -> None:
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(
+                    target=self._run,
+                    name=f"{self.model.__tablename__}-writer",
+                    daemon=True,
+                )
+                self._thread.start()
+                atexit.register(self.close)
+
+    def _run(self) -> None:
+        while True:
+            row = self._queue.get()
+            if row is _STOP:
+                return
+            batch = [row]
+            stop = False
+            deadline = time.monotonic() + self.max_wait
+            while len(batch) < self.max_batch:
+                timeout = deadline - time.monotonic()
+                if timeout <= 0:
+                    break
+                try:
+                    row = self._queue.get(timeout=timeout)
+                except queue.Empty:
+                    break
+                if row is _STOP:
+                    stop = True
+                    break
+                batch.append(row)
+            self._flush(batch)
+            if stop:
+                return
+
+    def _write(self, rows: list) -> None:
+        with get_session_local()() as db:
+            db.execute(self._insert, rows)
+            db.commit()
+
+    def _flush(self, batch: list) -> None:
+        table = self.model.__tablename__
+        for delay in (*RETRY_DELAYS, None):
+            try:
+                self._write(batch)
+                return
+            except Exception as e:
+                if delay is None or not _is_transient(e):
+                    logger.warning("Batch of %d %s rows failed, writing row by row: %s", len(batch), table, e)
+                    break
+                time.sleep(delay)
+        # Only the rows that fail on their own are dropped
+        for row in batch:
+            try:
+                self._write([row])
+            except Exception:
+                logger.exception("Dropped %s row %r", table, row)
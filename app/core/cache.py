@@ -0,0 +1,131 @@
+"""Lookup indexes shared by all workers of a deployment"""
+from functools import lru_cache
+import hashlib
+import logging
+import os
+
+import orjson
+
+try:
+    from redis import RedisError
+except ImportError:  # redis is only required when REDIS_URL is set
+    class RedisError(Exception):
+        pass
+
+logger = logging.getLogger(__name__)
+
+# Fields per HSET when writing many index entries to Redis
+HSET_CHUNK = 1000
+
+# Seconds to wait on Redis before treating a call as a miss, so an
+# unreachable server does not stall requests for the OS TCP timeout
+REDIS_TIMEOUT = 0.5
+
+# Seconds one worker's claim to rebuild a shared index lasts; workers that
+# start within this window (e.g. one deploy) leave the rebuild to it
+REBUILD_CLAIM_TTL = 300
+
+
+@lru_cache(maxsize=1)
+def get_redis():
+    """Redis client for REDIS_URL, or None when no Redis is configured"""
+    from config import get_config
+    url = get_config().REDIS_URL
+    if not url:
+        return None
+    import redis
+    return redis.Redis.from_url(url, socket_connect_timeout=REDIS_TIMEOUT, socket_timeout=REDIS_TIMEOUT)
+
+
+@lru_cache(maxsize=1)
+def _database_tag() -> str:
+    """Short stable id of the configured database, so deployments on
+    different databases sharing one Redis never read each other's entries"""
+    from app.core.database import get_engine
+    url = get_engine().url.render_as_string(hide_password=True)
+    return hashlib.sha1(url.encode()).hexdigest()[:12]
+
+
+class RecordIndex:
+    """Maps string keys to small JSON-serializable records.
+
+    Backed by a Redis hash named after `name` and the database when
+    REDIS_URL is set, so every worker sees the same entries; otherwise by
+    a per-process dict. Redis errors are logged and treated as misses, so
+    callers fall back to their own lookup.
+    """
+
+    def __init__(self, name: str):
+        self.name = name
+        self._local = {}
+
+    @property
+    def key(self) -> str:
+        return f"{self.name}:{_database_tag()}"
+
+    def get(self, key: str):
+        client = get_redis()
+        if client is None:
+            return self._local.get(key)
+        try:
+            value = client.hget(self.key, key)
+        except RedisError as e:
+            logger.warning(f"{self.name} lookup skipped: {e}")
+            return None
+        return orjson.loads(value) if value is not None else None
+
+    def update(self, entries: dict) -> None:
+        """Store many entries in one round trip"""
+        if not entries:
+            return
+        client = get_redis()
+        if client is None:
+            self._local.update(entries)
+            return
+        try:
+            self._write(client, self.key, entries)
+        except RedisError as e:
+            logger.warning(f"{self.name} update skipped: {e}")
+
+    def claim_rebuild(self) -> bool:
+        """True if this process should rebuild the shared index.
+
+        Only the first worker to ask within REBUILD_CLAIM_TTL seconds gets
+        True. Always False without Redis, where the per-process dict fills
+        on demand instead of holding a full copy in every worker.
+        """
+        client = get_redis()
+        if client is None:
+            return False
+        try:
+            return bool(client.set(f"{self.key}:rebuild", os.getpid(), nx=True, ex=REBUILD_CLAIM_TTL))
+        except RedisError as e:
+            logger.warning(f"{self.name} rebuild skipped: {e}")
+            return False
+
+    def replace(self, entries: dict) -> None:
+        """Swap the whole index for `entries`, dropping anything stale"""
+        client = get_redis()
+        if client is None:
+            self._local = dict(entries)
+            return
+        try:
+            if not entries:
+                client.delete(self.key)
+                return
+            # Build aside and RENAME, so readers never see a partial index
+            staging = f"{self.key}:staging:{os.getpid()}"
+            client.delete(staging)
+            self._write(client, staging, entries)
+            client.rename(staging, self.key)
+        except RedisError as e:
+            logger.warning(f"{self.name} rebuild skipped: {e}")
+
+    @staticmethod
+    def _write(client, key: str, entries: dict) -> None:
+        # Bounded HSETs keep a full warm-up from becoming one huge command
+        items = [(k, orjson.dumps(value)) for k, value in entries.items()]
+        pipe = client.pipeline(transaction=False)
+        for start in range(0, len(items), HSET_CHUNK):
+            pipe.hset(key, mapping=dict(items[start:start + HSET_CHUNK]))
+        pipe.execute()
@@ -1,24 +1,83 @@
 """Database configuration and session management for FastAPI"""
-from sqlalchemy import create_engine
+import orjson
+from sqlalchemy import JSON, DateTime, create_engine, inspect
+from sqlalchemy.dialects.postgresql import JSONB
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.compiler import compiles
 from sqlalchemy.orm import sessionmaker, declarative_base
+from sqlalchemy.pool import NullPool
+from sqlalchemy.sql.expression import FunctionElement
 
 # Create base class for models
 Base = declarative_base()
 
+# JSON column type stored as binary JSONB on PostgreSQL (parsed once on write)
+JSONBType = JSON().with_variant(JSONB(), "postgresql")
+
+class utcnow(FunctionElement):
+    """Naive UTC timestamp evaluated by the database, for created_at/updated_at"""
+    type = DateTime()
+    inherit_cache = True
+
+@compiles(utcnow, "postgresql")
+def _pg_utcnow(element, compiler, **kw):
+    return "TIMEZONE('utc', CURRENT_TIMESTAMP)"
+
+@compiles(utcnow)
+def _default_utcnow(element, compiler, **kw):
+    # SQLite's CURRENT_TIMESTAMP is already UTC
+    return "CURRENT_TIMESTAMP"
+
+# libpq TCP keepalives detect dead connections without a per-checkout ping
+PG_KEEPALIVE_ARGS = {"keepalives": 1, "keepalives_idle": 30, "keepalives_interval": 10}
+
 # Database engine and session maker - initialized on first use
 _engine = None
 _SessionLocal = None
 
-def get_engine():
-    """Get or create database engine"""
+def _json_serializer(value):
+    """Encode JSON column values with orjson (SQLAlchemy expects str)"""
+    return orjson.dumps(value, option=orjson.OPT_NON_STR_KEYS).decode()
+
+# JSON columns are encoded/decoded with orjson instead of the stdlib json module
+JSON_ENGINE_KWARGS = {"json_serializer": _json_serializer, "json_deserializer": orjson.loads}
+
+def _pool_kwargs(settings):
+    """Connection pool arguments for the engine"""
+    if settings.DB_NULL_POOL:
+        return {"poolclass": NullPool}
+    return {
+        "pool_size": settings.DB_POOL_SIZE,
+        "max_overflow": settings.DB_MAX_OVERFLOW,
+        "pool_recycle": settings.DB_POOL_RECYCLE,
+    }
+
+def get_engine(settings=None):
+    """Get or create database engine.
+
+    The first call builds the engine from `settings`, defaulting to the
+    config selected by APP_ENV; later calls return the same engine.
+    """
     global _engine
     if _engine is None:
-        from config import get_config
-        settings = get_config()
+        if settings is None:
+            from config import get_config
+            settings = get_config()
+        url = make_url(settings.DATABASE_URL)
+        connect_args = PG_KEEPALIVE_ARGS if url.get_backend_name() == "postgresql" else {}
+        dialect_kwargs = {}
+        if url.get_backend_name() == "postgresql" and url.get_driver_name() == "psycopg2":
+            # INSERTs already go through insertmanyvalues; this also routes
+            # executemany UPDATE/DELETE through psycopg2's execute_batch
+            dialect_kwargs["executemany_mode"] = "values_plus_batch"
         _engine = create_engine(
-            settings.DATABASE_URL,
+            url,
             echo=settings.SQLALCHEMY_ECHO,
-            pool_pre_ping=True,
+            pool_pre_ping=False,
+            connect_args=connect_args,
+            **dialect_kwargs,
+            **JSON_ENGINE_KWARGS,
+            **_pool_kwargs(settings),
         )
     return _engine
 
@@ -40,7 +99,13 @@ def get_db():
         db.close()
 
 def init_db():
-    """Initialize database tables"""
+    """Create any model tables missing from the database"""
+    # Register every model with Base.metadata before creating tables
+    from app.models import load_all_models
+    load_all_models()
     engine = get_engine()
-    Base.metadata.create_all(bind=engine)
-
+    # One catalog read instead of a per-table existence check
+    existing = set(inspect(engine).get_table_names())
+    missing = [table for table in Base.metadata.sorted_tables if table.name not in existing]
+    if missing:
+        Base.metadata.create_all(bind=engine, tables=missing, checkfirst=False)
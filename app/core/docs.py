@@ -0,0 +1,69 @@
+"""OpenAPI spec and interactive documentation endpoints"""
+import orjson
+from fastapi import FastAPI
+from fastapi.openapi.docs import (
+    get_redoc_html,
+    get_swagger_ui_html,
+    get_swagger_ui_oauth2_redirect_html,
+)
+from fastapi.responses import HTMLResponse, Response
+
+OPENAPI_URL = "/openapi.json"
+DOCS_URL = "/docs"
+REDOC_URL = "/redoc"
+OAUTH2_REDIRECT_URL = "/docs/oauth2-redirect"
+
+# Routes are fixed once the app is built, so clients and proxies may keep the spec
+OPENAPI_CACHE_CONTROL = "public, max-age=86400"
+DOCS_CACHE_CONTROL = "public, max-age=3600"
+
+
+def render_openapi(app: FastAPI) -> bytes:
+    """Serialize the application's OpenAPI schema to compact JSON bytes"""
+    return orjson.dumps(app.openapi(), option=orjson.OPT_NON_STR_KEYS)
+
+
+def register_docs(app: FastAPI, debug: bool = False) -> None:
+    """Register /openapi.json, /docs and /redoc on the application.
+
+    Must be called after all routers are included: the spec is built and
+    serialized here, once, so requests only hand back the stored bytes.
+    In debug mode it is rebuilt on every request so schema edits show up.
+    """
+    app.state.openapi_body = None if debug else render_openapi(app)
+
+    @app.get(OPENAPI_URL, include_in_schema=False)
+    async def openapi_json():
+        """Return the OpenAPI spec"""
+        if debug:
+            app.openapi_schema = None
+            return Response(render_openapi(app), media_type="application/json")
+        return Response(
+            app.state.openapi_body,
+            media_type="application/json",
+            headers={"Cache-Control": OPENAPI_CACHE_CONTROL},
+        )
+
+    # The docs pages are static for the life of the app; render them once
+    swagger_html = get_swagger_ui_html(
+        openapi_url=OPENAPI_URL,
+        title=f"{app.title} - Swagger UI",
+        oauth2_redirect_url=OAUTH2_REDIRECT_URL,
+    ).body
+    swagger_redirect_html = get_swagger_ui_oauth2_redirect_html().body
+    redoc_html = get_redoc_html(openapi_url=OPENAPI_URL, title=f"{app.title} - ReDoc").body
+
+    @app.get(DOCS_URL, include_in_schema=False)
+    async def swagger_ui():
+        """Swagger UI"""
+        return HTMLResponse(swagger_html, headers={"Cache-Control": DOCS_CACHE_CONTROL})
+
+    @app.get(OAUTH2_REDIRECT_URL, include_in_schema=False)
+    async def swagger_ui_redirect():
+        """Swagger UI OAuth2 redirect helper"""
+        return HTMLResponse(swagger_redirect_html, headers={"Cache-Control": DOCS_CACHE_CONTROL})
+
+    @app.get(REDOC_URL, include_in_schema=False)
+    async def redoc():
+        """ReDoc"""
+        return HTMLResponse(redoc_html, headers={"Cache-Control": DOCS_CACHE_CONTROL})
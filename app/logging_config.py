@@ -1,14 +1,46 @@
+import atexit
 import logging
 import logging.handlers
 import os
+import queue
+
+_FORMATTER = logging.Formatter("%(asctime)s %(levelname)-8s [%(name)s] %(message)s")
+
+_configured = False
+_listener = None
+
+
+def _start_listener(handlers) -> queue.Queue:
+    """Start a QueueListener feeding `handlers` and return its queue"""
+    global _listener
+    log_queue = queue.Queue(-1)
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
+    return log_queue
+
+
+def _stop_listener() -> None:
+    """Flush whatever is still queued when the process exits"""
+    if _listener is not None:
+        _listener.stop()
 
 
 def configure_logging(log_level: str | int = None, log_dir: str | None = None) -> None:
     """Configure root logger: console + rotating file handler.
 
+    Both handlers run on a background `QueueListener` thread; the root logger
+    only holds a `QueueHandler`, so logging calls never block on stream or disk I/O.
+
     - `log_level` can be a string like 'INFO' or an int from logging module.
     - `log_dir` defaults to a `logs` folder at project root.
+
+    Only the first call has an effect; later calls (e.g. every `create_app`)
+    return immediately instead of reopening the log file.
     """
+    global _configured
+    if _configured:
+        return
+
     if log_level is None:
         log_level = os.getenv("LOG_LEVEL", "INFO")
 
@@ -26,22 +58,29 @@ def configure_logging(log_level: str | int = None, log_dir: str | None = None) -
     # Console handler (stream)
     ch = logging.StreamHandler()
     ch.setLevel(log_level)
-    ch.setFormatter(logging.Formatter("%(asctime)s %(levelname)-8s [%(name)s] %(message)s"))
+    ch.setFormatter(_FORMATTER)
 
     # Rotating file handler
     fh = logging.handlers.RotatingFileHandler(
         os.path.join(log_dir, "app.log"), maxBytes=5 * 1024 * 1024, backupCount=3, encoding="utf-8"
     )
     fh.setLevel(log_level)
-    fh.setFormatter(logging.Formatter("%(asctime)s %(levelname)-8s [%(name)s] %(message)s"))
+    fh.setFormatter(_FORMATTER)
 
     # Clear existing handlers to avoid duplicate logs in some reload scenarios
     if root_logger.handlers:
         for h in list(root_logger.handlers):
             root_logger.removeHandler(h)
 
-    root_logger.addHandler(ch)
-    root_logger.addHandler(fh)
+    queue_handler = logging.handlers.QueueHandler(_start_listener((ch, fh)))
+    atexit.register(_stop_listener)
+    root_logger.addHandler(queue_handler)
+
+    # Forked workers (e.g. gunicorn --preload) inherit the QueueHandler but
+    # not the listener thread; give each child its own queue and listener
+    def _restart_in_child():
+        queue_handler.queue = _start_listener((ch, fh))
+    os.register_at_fork(after_in_child=_restart_in_child)
 
     logging.getLogger("alembic").setLevel(logging.WARN)
     # Suppress verbose SQLAlchemy engine INFO logs (e.g. SQL statements)
@@ -50,3 +89,5 @@ def configure_logging(log_level: str | int = None, log_dir: str | None = None) -
     # Some SQLAlchemy loggers include the class name as part of the logger
     # (e.g. 'sqlalchemy.engine.Engine') — set that explicitly as well.
     logging.getLogger("sqlalchemy.engine.Engine").setLevel(logging.WARN)
+
+    _configured = True
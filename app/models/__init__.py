@@ -1,17 +1,49 @@
-from app.models.doctor import (
-    Doctor, Degree, BoardCertification, Training, Employment,
-    DisciplinaryAction, MalpracticeCase
-)
-from app.models.academic import (
-    StudentSeed, AcademicRecord, EligibilityRule, MeritRule
-)
-from app.models.insurance import (
-    MedicalEnrichmentRequest, ReviewerRequest, PayoutRequest, NotificationRequest
-)
-
-__all__ = [
-    'Doctor', 'Degree', 'BoardCertification', 'Training', 'Employment',
-    'DisciplinaryAction', 'MalpracticeCase',
-    'StudentSeed', 'AcademicRecord', 'EligibilityRule', 'MeritRule',
-    'MedicalEnrichmentRequest', 'ReviewerRequest', 'PayoutRequest', 'NotificationRequest'
-]
+"""SQLAlchemy models.
+
+Model modules are imported on first attribute access (PEP 562), so a process
+that only touches one domain does not map every table. Use `load_all_models()`
+where the complete metadata is needed (table creation, Alembic).
+"""
+import importlib
+
+# model name -> defining module
+_MODEL_MODULES = {
+    'Doctor': 'app.models.doctor',
+    'Degree': 'app.models.doctor',
+    'BoardCertification': 'app.models.doctor',
+    'Training': 'app.models.doctor',
+    'Employment': 'app.models.doctor',
+    'StudentSeed': 'app.models.academic',
+    'AcademicRecord': 'app.models.academic',
+    'EligibilityRule': 'app.models.academic',
+    'MeritRule': 'app.models.academic',
+    'MedicalEnrichmentRequest': 'app.models.insurance',
+    'ReviewerRequest': 'app.models.insurance',
+    'PayoutRequest': 'app.models.insurance',
+    'NotificationRequest': 'app.models.insurance',
+    'HospitalVerification': 'app.models.insurance',
+    'PatientVerification': 'app.models.insurance',
+    'ComplianceRecord': 'app.models.compliance',
+    'Regulation': 'app.models.compliance',
+    'SanctionsEntry': 'app.models.compliance',
+    'FraudPattern': 'app.models.compliance',
+}
+
+__all__ = list(_MODEL_MODULES) + ['load_all_models']
+
+
+def __getattr__(name):
+    module_name = _MODEL_MODULES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module_name), name)
+
+
+def __dir__():
+    return sorted(set(globals()) | set(_MODEL_MODULES))
+
+
+def load_all_models():
+    """Import every model module so all tables are registered on Base.metadata"""
+    for module_name in dict.fromkeys(_MODEL_MODULES.values()):
+        importlib.import_module(module_name)
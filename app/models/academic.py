@@ -1,5 +1,4 @@
-from app.core.database import Base
-from datetime import datetime
+from app.core.database import Base, utcnow
 from sqlalchemy import Column, Integer, String, Float, DateTime, ForeignKey, JSON
 from sqlalchemy.orm import relationship
 
@@ -11,11 +10,11 @@ class StudentSeed(Base):
     student_id = Column(String(255), unique=True, nullable=False, index=True)
     name = Column(String(255), nullable=False)
     dob = Column(String(50), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     
     # Relationships
-    academic_records = relationship('AcademicRecord', backref='student', lazy=True, cascade='all, delete-orphan')
+    academic_records = relationship('AcademicRecord', backref='student', lazy='selectin', cascade='all, delete-orphan')
     
     def to_dict(self):
         return {
@@ -30,7 +29,7 @@ class AcademicRecord(Base):
     __tablename__ = 'academic_records'
     
     id = Column(Integer, primary_key=True)
-    student_id = Column(Integer, ForeignKey('student_seeds.id'), nullable=False)
+    student_id = Column(Integer, ForeignKey('student_seeds.id'), nullable=False, index=True)
     level = Column(String(50), nullable=False)  # 10th, 12th, Graduation
     board = Column(String(255), nullable=False)
     roll_number = Column(String(255), nullable=False, index=True)
@@ -57,8 +56,8 @@ class EligibilityRule(Base):
     min_marks = Column(Float, nullable=False)
     age_limit = Column(Integer, nullable=True)
     category_specific = Column(JSON, nullable=True)  # e.g., {"OBC": 55, "SC": 50}
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     
     def to_dict(self):
         return {
@@ -75,8 +74,8 @@ class MeritRule(Base):
     id = Column(Integer, primary_key=True)
     program = Column(String(255), unique=True, nullable=False, index=True)
     weightage = Column(JSON, nullable=False)  # e.g., {"12th_marks": 0.7, "graduation_marks": 0.3}
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     
     def to_dict(self):
         return {
@@ -2,8 +2,7 @@
 Compliance Models
 Database models for compliance records, regulations, sanctions, and fraud patterns
 """
-from app.core.database import Base
-from datetime import datetime
+from app.core.database import Base, utcnow
 from sqlalchemy import Column, Integer, String, DateTime, JSON, Text, Boolean, Date
 
 
@@ -18,7 +17,7 @@ class ComplianceRecord(Base):
     request_payload = Column(JSON, nullable=True)
     response_payload = Column(JSON, nullable=True)
     notes = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
     completed_at = Column(DateTime, nullable=True)
 
     def to_dict(self):
@@ -29,8 +28,8 @@ class ComplianceRecord(Base):
             "request_payload": self.request_payload,
             "response_payload": self.response_payload,
             "notes": self.notes,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "completed_at": self.completed_at.isoformat() if self.completed_at else None,
+            "created_at": self.created_at,
+            "completed_at": self.completed_at,
         }
 
 
@@ -53,8 +52,8 @@ class Regulation(Base):
     penalties = Column(JSON, nullable=True)
     tags = Column(JSON, nullable=True)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
     def to_dict(self):
         return {
@@ -64,7 +63,7 @@ class Regulation(Base):
             "category": self.category,
             "jurisdiction": self.jurisdiction,
             "version": self.version,
-            "effective_date": self.effective_date.isoformat() if self.effective_date else None,
+            "effective_date": self.effective_date,
             "description": self.description,
             "required_fields": self.required_fields,
             "key_articles": self.key_articles,
@@ -72,8 +71,8 @@ class Regulation(Base):
             "penalties": self.penalties,
             "tags": self.tags,
             "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
     def to_summary(self):
@@ -102,8 +101,8 @@ class SanctionsEntry(Base):
     reason = Column(Text, nullable=True)
     additional_info = Column(JSON, nullable=True)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
     def to_dict(self):
         return {
@@ -114,12 +113,12 @@ class SanctionsEntry(Base):
             "entity_type": self.entity_type,
             "country": self.country,
             "program": self.program,
-            "listing_date": self.listing_date.isoformat() if self.listing_date else None,
+            "listing_date": self.listing_date,
             "reason": self.reason,
             "additional_info": self.additional_info,
             "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
 
 
@@ -136,8 +135,8 @@ class FraudPattern(Base):
     risk_score_threshold = Column(Integer, nullable=True)
     action = Column(String(50), nullable=True)
     is_active = Column(Boolean, default=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
 
     def to_dict(self):
         return {
@@ -149,6 +148,6 @@ class FraudPattern(Base):
             "risk_score_threshold": self.risk_score_threshold,
             "action": self.action,
             "is_active": self.is_active,
-            "created_at": self.created_at.isoformat() if self.created_at else None,
-            "updated_at": self.updated_at.isoformat() if self.updated_at else None,
+            "created_at": self.created_at,
+            "updated_at": self.updated_at,
         }
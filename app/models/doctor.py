@@ -1,6 +1,5 @@
-from app.core.database import Base
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, ForeignKey, JSON
+from app.core.database import Base, JSONBType, utcnow
+from sqlalchemy import Column, Integer, String, Date, DateTime, ForeignKey
 from sqlalchemy.orm import relationship
 
 class Doctor(Base):
@@ -12,17 +11,18 @@ class Doctor(Base):
     name = Column(String(255), nullable=False)
     license_number = Column(String(255), unique=True, nullable=False, index=True)
     license_status = Column(String(50), nullable=False)  # Active, Inactive, Suspended
-    license_expiry = Column(String(50), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    license_expiry = Column(Date, nullable=True, index=True)  # NULL for unparseable legacy values
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
+    # Opaque records stored inline as JSONB arrays rather than one-column child tables
+    disciplinary_actions = Column(JSONBType, nullable=False, default=list)
+    malpractice_cases = Column(JSONBType, nullable=False, default=list)
     
     # Relationships
     degrees = relationship('Degree', backref='doctor', lazy=True, cascade='all, delete-orphan')
     board_certifications = relationship('BoardCertification', backref='doctor', lazy=True, cascade='all, delete-orphan')
     trainings = relationship('Training', backref='doctor', lazy=True, cascade='all, delete-orphan')
     employments = relationship('Employment', backref='doctor', lazy=True, cascade='all, delete-orphan')
-    disciplinary_actions = relationship('DisciplinaryAction', backref='doctor', lazy=True, cascade='all, delete-orphan')
-    malpractice_cases = relationship('MalpracticeCase', backref='doctor', lazy=True, cascade='all, delete-orphan')
     
     def to_dict(self):
         return {
@@ -35,8 +35,8 @@ class Doctor(Base):
             'board_certifications': [bc.to_dict() for bc in self.board_certifications],
             'training': [t.to_dict() for t in self.trainings],
             'employment_history': [e.to_dict() for e in self.employments],
-            'disciplinary_actions': [da.to_dict() for da in self.disciplinary_actions],
-            'malpractice_cases': [mc.to_dict() for mc in self.malpractice_cases],
+            'disciplinary_actions': self.disciplinary_actions or [],
+            'malpractice_cases': self.malpractice_cases or [],
         }
 
 class Degree(Base):
@@ -44,7 +44,7 @@ class Degree(Base):
     __tablename__ = 'degrees'
     
     id = Column(Integer, primary_key=True)
-    doctor_id = Column(Integer, ForeignKey('doctors.id'), nullable=False)
+    doctor_id = Column(Integer, ForeignKey('doctors.id'), nullable=False, index=True)
     degree_name = Column(String(255), nullable=False)
     university = Column(String(255), nullable=False)
     year_of_passing = Column(String(50), nullable=False)
@@ -63,10 +63,10 @@ class BoardCertification(Base):
     __tablename__ = 'board_certifications'
     
     id = Column(Integer, primary_key=True)
-    doctor_id = Column(Integer, ForeignKey('doctors.id'), nullable=False)
+    doctor_id = Column(Integer, ForeignKey('doctors.id'), nullable=False, index=True)
     board_name = Column(String(255), nullable=False)
     certificate_number = Column(String(255), unique=True, nullable=False, index=True)
-    valid_till = Column(String(50), nullable=False)
+    valid_till = Column(Date, nullable=True)  # NULL for unparseable legacy values
     
     def to_dict(self):
         return {
@@ -80,7 +80,7 @@ class Training(Base):
     __tablename__ = 'trainings'
     
     id = Column(Integer, primary_key=True)
-    doctor_id = Column(Integer, ForeignKey('doctors.id'), nullable=False)
+    doctor_id = Column(Integer, ForeignKey('doctors.id'), nullable=False, index=True)
     program_name = Column(String(255), nullable=False)
     institution = Column(String(255), nullable=False)
     completion_year = Column(String(50), nullable=False)
@@ -97,7 +97,7 @@ class Employment(Base):
     __tablename__ = 'employments'
     
     id = Column(Integer, primary_key=True)
-    doctor_id = Column(Integer, ForeignKey('doctors.id'), nullable=False)
+    doctor_id = Column(Integer, ForeignKey('doctors.id'), nullable=False, index=True)
     employer_name = Column(String(255), nullable=False)
     role = Column(String(255), nullable=False)
     years = Column(String(50), nullable=False)
@@ -108,25 +108,3 @@ class Employment(Base):
             'role': self.role,
             'years': self.years
         }
-
-class DisciplinaryAction(Base):
-    """Doctor's disciplinary actions"""
-    __tablename__ = 'disciplinary_actions'
-    
-    id = Column(Integer, primary_key=True)
-    doctor_id = Column(Integer, ForeignKey('doctors.id'), nullable=False)
-    data = Column(JSON, nullable=False)
-    
-    def to_dict(self):
-        return self.data
-
-class MalpracticeCase(Base):
-    """Doctor's malpractice cases"""
-    __tablename__ = 'malpractice_cases'
-    
-    id = Column(Integer, primary_key=True)
-    doctor_id = Column(Integer, ForeignKey('doctors.id'), nullable=False)
-    data = Column(JSON, nullable=False)
-    
-    def to_dict(self):
-        return self.data
@@ -1,6 +1,5 @@
-from app.core.database import Base
-from datetime import datetime
-from sqlalchemy import Column, Integer, String, Boolean, Text, DateTime, Numeric, JSON
+from app.core.database import Base, JSONBType, utcnow
+from sqlalchemy import Column, Integer, String, Boolean, Text, DateTime, Numeric
 
 class MedicalEnrichmentRequest(Base):
     """Medical data enrichment requests"""
@@ -9,9 +8,9 @@ class MedicalEnrichmentRequest(Base):
     id = Column(Integer, primary_key=True)
     diagnosis = Column(String(255), nullable=False)
     hospital_name = Column(String(255), nullable=False)
-    icd_mapping = Column(JSON, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    icd_mapping = Column(JSONBType, nullable=True)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     
     def to_dict(self):
         return {
@@ -19,8 +18,8 @@ class MedicalEnrichmentRequest(Base):
             'diagnosis': self.diagnosis,
             'hospital_name': self.hospital_name,
             'icd_mapping': self.icd_mapping,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 class ReviewerRequest(Base):
@@ -28,16 +27,16 @@ class ReviewerRequest(Base):
     __tablename__ = 'reviewer_requests'
     
     id = Column(Integer, primary_key=True)
-    workflow_state = Column(JSON, nullable=False)  # Dict with workflow state
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    workflow_state = Column(JSONBType, nullable=False)  # Dict with workflow state
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     
     def to_dict(self):
         return {
             'id': self.id,
             'workflow_state': self.workflow_state,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 class PayoutRequest(Base):
@@ -45,20 +44,21 @@ class PayoutRequest(Base):
     __tablename__ = 'payout_requests'
     
     id = Column(Integer, primary_key=True)
-    approved_amount = Column(Numeric(10, 2), nullable=False)
-    deductible = Column(Numeric(10, 2), nullable=False)
-    policy_limit = Column(Numeric(10, 2), nullable=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    # asdecimal=False: amounts are loaded as float, matching the API schemas
+    approved_amount = Column(Numeric(10, 2, asdecimal=False), nullable=False)
+    deductible = Column(Numeric(10, 2, asdecimal=False), nullable=False)
+    policy_limit = Column(Numeric(10, 2, asdecimal=False), nullable=False)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     
     def to_dict(self):
         return {
             'id': self.id,
-            'approved_amount': float(self.approved_amount),
-            'deductible': float(self.deductible),
-            'policy_limit': float(self.policy_limit),
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'approved_amount': self.approved_amount,
+            'deductible': self.deductible,
+            'policy_limit': self.policy_limit,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 class NotificationRequest(Base):
@@ -70,8 +70,8 @@ class NotificationRequest(Base):
     subject = Column(String(255), nullable=False)
     message = Column(Text, nullable=False)
     sent = Column(Boolean, default=False)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     
     def to_dict(self):
         return {
@@ -80,8 +80,8 @@ class NotificationRequest(Base):
             'subject': self.subject,
             'message': self.message,
             'sent': self.sent,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 
@@ -94,17 +94,17 @@ class HospitalVerification(Base):
     hospital_name = Column(String(255), nullable=False)
     verified = Column(Boolean, default=False)
     verified_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     
     def to_dict(self):
         return {
             'registration_number': self.registration_number,
             'hospital_name': self.hospital_name,
             'verified': self.verified,
-            'verified_at': self.verified_at.isoformat() if self.verified_at else None,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'verified_at': self.verified_at,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
 
@@ -120,8 +120,8 @@ class PatientVerification(Base):
     gender = Column(String(10), nullable=False)
     verified = Column(Boolean, default=False)
     verified_at = Column(DateTime, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=utcnow())
+    updated_at = Column(DateTime, server_default=utcnow(), onupdate=utcnow())
     
     def to_dict(self):
         return {
@@ -131,8 +131,8 @@ class PatientVerification(Base):
             'date_of_birth': self.date_of_birth,
             'gender': self.gender,
             'verified': self.verified,
-            'verified_at': self.verified_at.isoformat() if self.verified_at else None,
-            'created_at': self.created_at.isoformat(),
-            'updated_at': self.updated_at.isoformat()
+            'verified_at': self.verified_at,
+            'created_at': self.created_at,
+            'updated_at': self.updated_at
         }
 
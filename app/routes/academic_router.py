@@ -1,72 +1,139 @@
 from fastapi import APIRouter, HTTPException, Depends
+from sqlalchemy import bindparam, exists, func, insert, select
 from sqlalchemy.orm import Session
+from app.core.cache import RecordIndex
 from app.core.database import get_db
 from app.models.academic import StudentSeed, AcademicRecord, EligibilityRule, MeritRule
 from app.schemas.academic_schema import StudentSeedSchema, EligibilityRuleSchema, MeritRuleSchema
 
 router = APIRouter()
 
-# In-memory indexes
-ROLL_INDEX = {}      # roll_number → student_id
-CERT_INDEX = {}      # certificate_number → student_id
+# Indexes of verification results, filled on seed and on lookup; when
+# shared through Redis (REDIS_URL) they are also rebuilt once per deploy
+ROLL_INDEX = RecordIndex('academic:roll_index')  # roll_number → {student_id, year_of_passing, marks}
+CERT_INDEX = RecordIndex('academic:cert_index')  # certificate_number → {student_id, level, marks}
+
+# Program rules are insert-only, so cached entries never go stale; misses
+# are not cached so a rule added by another worker is picked up
+_MIN_MARKS = {}   # program → EligibilityRule.min_marks
+_WEIGHTAGE = {}   # program → MeritRule.weightage
+
+def _record_entries(rows):
+    """What the verify endpoints return for (student_id, record) pairs, keyed per index"""
+    roll_entries = {}
+    cert_entries = {}
+    for student_id, record in rows:
+        roll_entries[record.roll_number] = {
+            'student_id': student_id,
+            'year_of_passing': record.year_of_passing,
+            'marks': record.marks
+        }
+        cert_entries[record.certificate_number] = {
+            'student_id': student_id,
+            'level': record.level,
+            'marks': record.marks
+        }
+    return roll_entries, cert_entries
+
+def _index_records(rows):
+    """Cache what the verify endpoints return for (student_id, record) pairs"""
+    roll_entries, cert_entries = _record_entries(rows)
+    ROLL_INDEX.update(roll_entries)
+    CERT_INDEX.update(cert_entries)
+    return roll_entries, cert_entries
+
+# Academic record columns joined to the owning student's public id; plain
+# Core statements built once, so lookups skip ORM entity handling
+_RECORD_ROWS = select(
+    StudentSeed.student_id,
+    AcademicRecord.roll_number,
+    AcademicRecord.certificate_number,
+    AcademicRecord.level,
+    AcademicRecord.year_of_passing,
+    AcademicRecord.marks
+).join_from(AcademicRecord, StudentSeed, AcademicRecord.student_id == StudentSeed.id)
+_ROLL_LOOKUP = _RECORD_ROWS.where(AcademicRecord.roll_number == bindparam('roll_number')).limit(1)
+_CERT_LOOKUP = _RECORD_ROWS.where(AcademicRecord.certificate_number == bindparam('certificate_number')).limit(1)
+
+def load_indexes(db: Session) -> None:
+    """Rebuild the shared ROLL_INDEX and CERT_INDEX from every stored academic
+    record, replacing entries left by an earlier run.
+
+    Runs in at most one worker per deploy (the one that claims the rebuild)
+    and not at all without Redis, where the indexes fill on demand.
+    """
+    # One claim covers both indexes
+    if not ROLL_INDEX.claim_rebuild():
+        return
+    roll_entries, cert_entries = _record_entries(
+        (row.student_id, row) for row in db.execute(_RECORD_ROWS)
+    )
+    ROLL_INDEX.replace(roll_entries)
+    CERT_INDEX.replace(cert_entries)
 
 @router.post('/admin/students')
 def add_student(data: list[StudentSeedSchema], db: Session = Depends(get_db)):
     """Admin endpoint to seed students into database"""
-    try:
-        if not isinstance(data, list):
-            raise HTTPException(status_code=400, detail='Expected a list of students')
-        
-        added_ids = []
+    if not isinstance(data, list):
+        raise HTTPException(status_code=400, detail='Expected a list of students')
+    
+    # Commits on success, rolls back if anything raises
+    with db.begin():
+        # One query for every already-seeded id in the batch
+        incoming_ids = [student_data.student_id for student_data in data]
+        existing_ids = {
+            row.student_id for row in
+            db.query(StudentSeed.student_id).filter(StudentSeed.student_id.in_(incoming_ids))
+        }
+        new_students = [s for s in data if s.student_id not in existing_ids]
         
-        for student_data in data:
-            # Check if student already exists
-            existing = db.query(StudentSeed).filter_by(student_id=student_data.student_id).first()
-            if existing:
-                continue
-            
-            # Create student
-            student = StudentSeed(
-                student_id=student_data.student_id,
-                name=student_data.name,
-                dob=student_data.dob
-            )
-            
-            # Add academic records
-            for record in student_data.academic_records:
-                acad_record = AcademicRecord(
-                    level=record.level,
-                    board=record.board,
-                    roll_number=record.roll_number,
-                    year_of_passing=record.year_of_passing,
-                    marks=record.marks,
-                    certificate_number=record.certificate_number,
-                    student=student
+        student_rows = [
+            {
+                'student_id': student_data.student_id,
+                'name': student_data.name,
+                'dob': student_data.dob
+            }
+            for student_data in new_students
+        ]
+        # One multi-row INSERT; RETURNING maps each public id to its generated key
+        pk_by_student_id = {}
+        if student_rows:
+            pk_by_student_id = {
+                row.student_id: row.id for row in db.execute(
+                    insert(StudentSeed).returning(StudentSeed.id, StudentSeed.student_id),
+                    student_rows
                 )
-                db.add(acad_record)
-                ROLL_INDEX[record.roll_number] = student_data.student_id
-                CERT_INDEX[record.certificate_number] = student_data.student_id
-            
-            db.add(student)
-            added_ids.append(student_data.student_id)
+            }
         
-        db.commit()
-        
-        return {
-            'message': f'Batch processed. {len(added_ids)} students added.',
-            'student_ids': added_ids
-        }
+        record_rows = []
+        indexed = []
+        for student_data in new_students:
+            for record in student_data.academic_records:
+                record_rows.append({
+                    'level': record.level,
+                    'board': record.board,
+                    'roll_number': record.roll_number,
+                    'year_of_passing': record.year_of_passing,
+                    'marks': record.marks,
+                    'certificate_number': record.certificate_number,
+                    'student_id': pk_by_student_id[student_data.student_id]
+                })
+                indexed.append((student_data.student_id, record))
+        db.bulk_insert_mappings(AcademicRecord, record_rows)
+        added_ids = [student_data.student_id for student_data in new_students]
+    
+    _index_records(indexed)
     
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=str(e))
+    return {
+        'message': f'Batch processed. {len(added_ids)} students added.',
+        'student_ids': added_ids
+    }
 
 @router.post('/admin/eligibility-rules')
 def add_eligibility_rule(data: EligibilityRuleSchema, db: Session = Depends(get_db)):
     """Admin endpoint to add eligibility rules"""
-    try:
-        existing = db.query(EligibilityRule).filter_by(program=data.program).first()
-        if existing:
+    with db.begin():
+        if db.query(exists().where(EligibilityRule.program == data.program)).scalar():
             raise HTTPException(status_code=400, detail='Rule for this program already exists')
         
         rule = EligibilityRule(
@@ -77,23 +144,19 @@ def add_eligibility_rule(data: EligibilityRuleSchema, db: Session = Depends(get_
         )
         
         db.add(rule)
-        db.commit()
-        
-        return {
-            'message': 'Eligibility rule added',
-            'program': data.program
-        }
     
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=str(e))
+    _MIN_MARKS[data.program] = data.min_marks
+    
+    return {
+        'message': 'Eligibility rule added',
+        'program': data.program
+    }
 
 @router.post('/admin/merit-rules')
 def add_merit_rule(data: MeritRuleSchema, db: Session = Depends(get_db)):
     """Admin endpoint to add merit calculation rules"""
-    try:
-        existing = db.query(MeritRule).filter_by(program=data.program).first()
-        if existing:
+    with db.begin():
+        if db.query(exists().where(MeritRule.program == data.program)).scalar():
             raise HTTPException(status_code=400, detail='Rule for this program already exists')
         
         rule = MeritRule(
@@ -102,16 +165,13 @@ def add_merit_rule(data: MeritRuleSchema, db: Session = Depends(get_db)):
         )
         
         db.add(rule)
-        db.commit()
-        
-        return {
-            'message': 'Merit rule added',
-            'program': data.program
-        }
     
-    except Exception as e:
-        db.rollback()
-        raise HTTPException(status_code=500, detail=str(e))
+    _WEIGHTAGE[data.program] = data.weightage
+    
+    return {
+        'message': 'Merit rule added',
+        'program': data.program
+    }
 
 @router.get('/verify/roll-number')
 def verify_roll_number(roll_number: str, db: Session = Depends(get_db)):
@@ -119,16 +179,19 @@ def verify_roll_number(roll_number: str, db: Session = Depends(get_db)):
     if not roll_number:
         raise HTTPException(status_code=400, detail='roll_number parameter required')
     
-    record = db.query(AcademicRecord).filter_by(roll_number=roll_number).first()
-    
-    if not record:
-        raise HTTPException(status_code=404, detail='Roll number not found')
+    entry = ROLL_INDEX.get(roll_number)
+    if entry is None:
+        row = db.execute(_ROLL_LOOKUP, {'roll_number': roll_number}).first()
+        if not row:
+            raise HTTPException(status_code=404, detail='Roll number not found')
+        roll_entries, _ = _index_records([(row.student_id, row)])
+        entry = roll_entries[roll_number]
     
     return {
-        'student_id': record.student.student_id,
+        'student_id': entry['student_id'],
         'roll_number': roll_number,
-        'year_of_passing': record.year_of_passing,
-        'marks': record.marks,
+        'year_of_passing': entry['year_of_passing'],
+        'marks': entry['marks'],
         'verified': True
     }
 
@@ -138,16 +201,19 @@ def verify_certificate(certificate_number: str, db: Session = Depends(get_db)):
     if not certificate_number:
         raise HTTPException(status_code=400, detail='certificate_number parameter required')
     
-    record = db.query(AcademicRecord).filter_by(certificate_number=certificate_number).first()
-    
-    if not record:
-        raise HTTPException(status_code=404, detail='Certificate not found')
+    entry = CERT_INDEX.get(certificate_number)
+    if entry is None:
+        row = db.execute(_CERT_LOOKUP, {'certificate_number': certificate_number}).first()
+        if not row:
+            raise HTTPException(status_code=404, detail='Certificate not found')
+        _, cert_entries = _index_records([(row.student_id, row)])
+        entry = cert_entries[certificate_number]
     
     return {
         'certificate_number': certificate_number,
-        'student_id': record.student.student_id,
-        'level': record.level,
-        'marks': record.marks,
+        'student_id': entry['student_id'],
+        'level': entry['level'],
+        'marks': entry['marks'],
         'verified': True
     }
 
@@ -157,23 +223,30 @@ def check_eligibility(student_id: str, program: str, db: Session = Depends(get_d
     if not student_id or not program:
         raise HTTPException(status_code=400, detail='student_id and program parameters required')
     
-    student = db.query(StudentSeed).filter_by(student_id=student_id).first()
-    if not student:
+    # Student existence and highest marks in one round trip
+    student = db.query(
+        StudentSeed.id, func.max(AcademicRecord.marks).label('max_marks')
+    ).outerjoin(
+        AcademicRecord, AcademicRecord.student_id == StudentSeed.id
+    ).filter(StudentSeed.student_id == student_id).group_by(StudentSeed.id).first()
+    if student is None:
         raise HTTPException(status_code=404, detail='Student not found')
     
-    rule = db.query(EligibilityRule).filter_by(program=program).first()
-    if not rule:
-        raise HTTPException(status_code=404, detail='Program not found')
+    min_marks = _MIN_MARKS.get(program)
+    if min_marks is None:
+        min_marks = db.query(EligibilityRule.min_marks).filter_by(program=program).scalar()
+        if min_marks is None:
+            raise HTTPException(status_code=404, detail='Program not found')
+        _MIN_MARKS[program] = min_marks
     
-    # Get the student's highest marks
-    max_marks = max([record.marks for record in student.academic_records], default=0)
-    eligible = max_marks >= rule.min_marks
+    max_marks = student.max_marks or 0
+    eligible = max_marks >= min_marks
     
     return {
         'eligible': eligible,
         'program': program,
         'student_marks': max_marks,
-        'required_marks': rule.min_marks,
+        'required_marks': min_marks,
         'message': 'Student is eligible' if eligible else 'Student does not meet minimum marks'
     }
 
@@ -183,20 +256,33 @@ def calculate_merit(student_id: str, program: str, db: Session = Depends(get_db)
     if not student_id or not program:
         raise HTTPException(status_code=400, detail='student_id and program parameters required')
     
-    student = db.query(StudentSeed).filter_by(student_id=student_id).first()
-    if not student:
+    student_pk = db.query(StudentSeed.id).filter_by(student_id=student_id).scalar()
+    if student_pk is None:
         raise HTTPException(status_code=404, detail='Student not found')
     
-    rule = db.query(MeritRule).filter_by(program=program).first()
-    if not rule:
-        raise HTTPException(status_code=404, detail='Merit rule not found')
+    weightage = _WEIGHTAGE.get(program)
+    if weightage is None:
+        weightage = db.query(MeritRule.weightage).filter_by(program=program).scalar()
+        if weightage is None:
+            raise HTTPException(status_code=404, detail='Merit rule not found')
+        _WEIGHTAGE[program] = weightage
+    
+    # Only the (level, marks) pairs are needed; key them by lowercased level
+    marks_by_level = {}
+    for lvl, marks in db.query(AcademicRecord.level, AcademicRecord.marks).filter_by(student_id=student_pk):
+        marks_by_level.setdefault(lvl.lower(), marks)
     
     # Calculate merit based on weightage
     merit_score = 0.0
-    for level, weightage in rule.weightage.items():
-        record = next((r for r in student.academic_records if r.level.lower() in level.lower()), None)
-        if record:
-            merit_score += record.marks * weightage
+    for level, weight in weightage.items():
+        level = level.lower()
+        # Exact level match first, then a record level contained in the key
+        # (e.g. "12th" for "12th_marks")
+        marks = marks_by_level.get(level)
+        if marks is None:
+            marks = next((m for lvl, m in marks_by_level.items() if lvl in level), None)
+        if marks is not None:
+            merit_score += marks * weight
     
     return {
         'student_id': student_id,
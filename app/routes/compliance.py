@@ -2,13 +2,22 @@
 Legacy Compliance Check Endpoints
 These provide specific compliance framework checks (GDPR, PCI, HIPAA, ISO27001, Market)
 """
-from fastapi import APIRouter, Depends
-from datetime import datetime
+from typing import Annotated
+from fastapi import APIRouter, Body, HTTPException
+from datetime import datetime, timezone
+from functools import lru_cache
+from types import MappingProxyType
+import os
+import threading
+import time
 import uuid
-from sqlalchemy.orm import Session
-from app.core.database import get_db
+from pydantic import ValidationError
+from app.core.batch_writer import BatchWriter
 from app.models.compliance import ComplianceRecord
 from app.schemas.compliance_schema import (
+    MAX_BATCH_CHECKS,
+    BatchCheckRequest,
+    BatchCheckResponse,
     PEPCheckRequest,
     PEPCheckResponse,
     GDPRCheckRequest,
@@ -25,41 +34,29 @@ from app.schemas.compliance_schema import (
 
 router = APIRouter()
 
+# Check results are persisted in batches off the request path
+COMPLIANCE_WRITER = BatchWriter(ComplianceRecord, max_batch=MAX_BATCH_CHECKS, max_wait=0.025)
+
 
 # ============================================
-# Specific Compliance Framework Checks
+# Check evaluators
+# Each returns (status, check-specific response fields)
 # ============================================
 
-@router.post("/aml/pep", response_model=PEPCheckResponse, tags=["AML"])
-def pep_check(payload: PEPCheckRequest, db: Session = Depends(get_db)):
-    """POST /compliance/aml/pep - Check if entity is a PEP (Politically Exposed Person)"""
-    request_id = str(uuid.uuid4())
-    response_data = {
-        "request_id": request_id,
-        "status": "completed",
-        "checked_at": datetime.utcnow().isoformat(),
-        "is_pep": False,
-        "pep_category": None,
-        "risk_level": "low",
-    }
-    
-    record = ComplianceRecord(
-        request_id=request_id,
-        check_type="pep",
-        status="completed",
-        request_payload=payload.dict(),
-        response_payload=response_data,
-        completed_at=datetime.utcnow(),
-    )
-    db.add(record)
-    db.commit()
-    
-    return response_data
+# Read-only result fields shared by every check that finds nothing
+_PEP_CLEAR = MappingProxyType({"is_pep": False, "pep_category": None, "risk_level": "low"})
+_GDPR_PASS = MappingProxyType({"compliance_score": 100, "missing_requirements": ()})
+_PCI_PASS = MappingProxyType({"compliant": True, "issues": ()})
+_HIPAA_PASS = MappingProxyType({"compliant": True, "violations": ()})
+_ISO_PASS = MappingProxyType({"maturity_level": "high", "gaps": ()})
+_MARKET_PASS = MappingProxyType({"compliant": True, "remarks": ()})
 
 
-@router.post("/gdpr/check", response_model=GDPRCheckResponse, tags=["GDPR"])
-def gdpr_check(payload: GDPRCheckRequest, db: Session = Depends(get_db)):
-    """POST /compliance/gdpr/check - Verify GDPR compliance requirements"""
+def _eval_pep(payload: PEPCheckRequest):
+    return "completed", _PEP_CLEAR
+
+
+def _eval_gdpr(payload: GDPRCheckRequest):
     missing = []
     if not payload.has_privacy_policy:
         missing.append("privacy_policy")
@@ -67,155 +64,263 @@ def gdpr_check(payload: GDPRCheckRequest, db: Session = Depends(get_db)):
         missing.append("consent_mechanism")
     if not payload.data_retention_policy:
         missing.append("data_retention_policy")
+    if not missing:
+        return "compliant", _GDPR_PASS
 
     score = 100 - (len(missing) * 30)
-    request_id = str(uuid.uuid4())
-    response_data = {
-        "request_id": request_id,
-        "status": "compliant" if score >= 70 else "non_compliant",
-        "checked_at": datetime.utcnow().isoformat(),
+    return "compliant" if score >= 70 else "non_compliant", {
         "compliance_score": max(score, 0),
         "missing_requirements": missing,
     }
-    
-    record = ComplianceRecord(
-        request_id=request_id,
-        check_type="gdpr",
-        status="completed",
-        request_payload=payload.dict(),
-        response_payload=response_data,
-        completed_at=datetime.utcnow(),
-    )
-    db.add(record)
-    db.commit()
-    
-    return response_data
 
 
-@router.post("/pci/check", response_model=PCICheckResponse, tags=["PCI-DSS"])
-def pci_check(payload: PCICheckRequest, db: Session = Depends(get_db)):
-    """POST /compliance/pci/check - Verify PCI DSS compliance requirements"""
+def _eval_pci(payload: PCICheckRequest):
     issues = []
     if payload.stores_card_data and not payload.encryption_enabled:
         issues.append("Card data stored without encryption")
     if not payload.access_control:
         issues.append("Weak access control")
+    if not issues:
+        return "completed", _PCI_PASS
 
-    request_id = str(uuid.uuid4())
-    response_data = {
-        "request_id": request_id,
-        "status": "completed",
-        "checked_at": datetime.utcnow().isoformat(),
-        "compliant": len(issues) == 0,
+    return "completed", {
+        "compliant": False,
         "issues": issues,
     }
-    
-    record = ComplianceRecord(
-        request_id=request_id,
-        check_type="pci",
-        status="completed",
-        request_payload=payload.dict(),
-        response_payload=response_data,
-        completed_at=datetime.utcnow(),
-    )
-    db.add(record)
-    db.commit()
-    
-    return response_data
 
 
-@router.post("/hipaa/check", response_model=HIPAACheckResponse, tags=["HIPAA"])
-def hipaa_check(payload: HIPAACheckRequest, db: Session = Depends(get_db)):
-    """POST /compliance/hipaa/check - Verify HIPAA compliance requirements"""
+def _eval_hipaa(payload: HIPAACheckRequest):
     violations = []
     if payload.handles_phi and not payload.access_logging:
         violations.append("Missing access logs for PHI")
     if payload.handles_phi and not payload.breach_policy:
         violations.append("No breach notification policy")
+    if not violations:
+        return "completed", _HIPAA_PASS
 
-    request_id = str(uuid.uuid4())
-    response_data = {
-        "request_id": request_id,
-        "status": "completed",
-        "checked_at": datetime.utcnow().isoformat(),
-        "compliant": len(violations) == 0,
+    return "completed", {
+        "compliant": False,
         "violations": violations,
     }
-    
-    record = ComplianceRecord(
-        request_id=request_id,
-        check_type="hipaa",
-        status="completed",
-        request_payload=payload.dict(),
-        response_payload=response_data,
-        completed_at=datetime.utcnow(),
-    )
-    db.add(record)
-    db.commit()
-    
-    return response_data
 
 
-@router.post("/iso27001/check", response_model=ISO27001Response, tags=["ISO27001"])
-def iso_check(payload: ISO27001Request, db: Session = Depends(get_db)):
-    """POST /compliance/iso27001/check - Verify ISO 27001 compliance requirements"""
+def _eval_iso27001(payload: ISO27001Request):
     gaps = []
     if not payload.risk_assessment_done:
         gaps.append("Risk assessment missing")
     if not payload.incident_management:
         gaps.append("Incident management missing")
+    if not gaps:
+        return "completed", _ISO_PASS
 
-    maturity = "high" if not gaps else "medium"
-    request_id = str(uuid.uuid4())
-    response_data = {
-        "request_id": request_id,
-        "status": "completed",
-        "checked_at": datetime.utcnow().isoformat(),
-        "maturity_level": maturity,
+    return "completed", {
+        "maturity_level": "medium",
         "gaps": gaps,
     }
-    
-    record = ComplianceRecord(
-        request_id=request_id,
-        check_type="iso27001",
-        status="completed",
-        request_payload=payload.dict(),
-        response_payload=response_data,
-        completed_at=datetime.utcnow(),
-    )
-    db.add(record)
-    db.commit()
-    
-    return response_data
 
 
-@router.post("/market/check", response_model=MarketComplianceResponse, tags=["Market Compliance"])
-def market_check(payload: MarketComplianceRequest, db: Session = Depends(get_db)):
-    """POST /compliance/market/check - Verify market compliance (FINRA/MiFID)"""
+def _eval_market(payload: MarketComplianceRequest):
     remarks = []
     if not payload.trade_monitoring:
         remarks.append("Trade monitoring missing")
     if not payload.conflict_policy:
         remarks.append("Conflict of interest policy missing")
+    if not remarks:
+        return "completed", _MARKET_PASS
 
-    request_id = str(uuid.uuid4())
-    response_data = {
-        "request_id": request_id,
-        "status": "completed",
-        "checked_at": datetime.utcnow().isoformat(),
-        "compliant": len(remarks) == 0,
+    return "completed", {
+        "compliant": False,
         "remarks": remarks,
     }
+
+
+# check_type -> evaluator
+EVALUATORS = {
+    "pep": _eval_pep,
+    "gdpr": _eval_gdpr,
+    "pci": _eval_pci,
+    "hipaa": _eval_hipaa,
+    "iso27001": _eval_iso27001,
+    "market": _eval_market,
+}
+
+
+class _RandPool:
+    """Hands out 16-byte slices of one os.urandom(chunksize) buffer, refilled when spent"""
+
+    def __init__(self, chunksize: int = 4096):
+        self.chunksize = chunksize
+        self.reset()
+        # A forked worker must not hand out the parent's remaining bytes
+        os.register_at_fork(after_in_child=self.reset)
+
+    def reset(self) -> None:
+        """Discard buffered bytes so the next take() reads fresh ones"""
+        self._buf = b""
+        self._pos = 0
+        self._lock = threading.Lock()
+
+    def take(self, count: int) -> list:
+        """`count` 16-byte random values"""
+        with self._lock:
+            out = []
+            while len(out) < count:
+                if self._pos + 16 > len(self._buf):
+                    self._buf = os.urandom(max(self.chunksize, 16 * (count - len(out))))
+                    self._pos = 0
+                end = min(len(self._buf), self._pos + 16 * (count - len(out)))
+                out.extend(self._buf[i:i + 16] for i in range(self._pos, end, 16))
+                self._pos = end
+            return out
+
+
+_rand = _RandPool(chunksize=4096)
+
+
+def _uuid4_batch(count: int) -> list:
+    """`count` random (version 4) UUID strings, in the usual dashed form"""
+    return [str(uuid.UUID(bytes=raw, version=4)) for raw in _rand.take(count)]
+
+
+@lru_cache(maxsize=1)
+def _timestamp(ms: int) -> tuple:
+    """(naive UTC datetime, ISO string) for a millisecond epoch; shared by checks in the same ms"""
+    now = datetime.fromtimestamp(ms / 1000, timezone.utc).replace(tzinfo=None)
+    return now, now.isoformat()
+
+
+def _run_mixed(checks: list) -> list:
+    """Evaluate (check_type, payload) pairs, queue their ComplianceRecords and return the response bodies in order"""
+    now, checked_at = _timestamp(time.time_ns() // 1_000_000)
+    responses = []
+    rows = []
+    for (check_type, payload), request_id in zip(checks, _uuid4_batch(len(checks))):
+        status, result = EVALUATORS[check_type](payload)
+        response_data = {
+            "request_id": request_id,
+            "status": status,
+            "checked_at": checked_at,
+            **result,
+        }
+        responses.append(response_data)
+        rows.append({
+            "request_id": request_id,
+            "check_type": check_type,
+            "status": "completed",
+            "request_payload": payload.model_dump(),
+            "response_payload": response_data,
+            "completed_at": now,
+        })
     
-    record = ComplianceRecord(
-        request_id=request_id,
-        check_type="market",
-        status="completed",
-        request_payload=payload.dict(),
-        response_payload=response_data,
-        completed_at=datetime.utcnow(),
-    )
-    db.add(record)
-    db.commit()
+    COMPLIANCE_WRITER.put_many(rows)
     
-    return response_data
+    return responses
+
+
+def _run_checks(check_type: str, payloads: list) -> list:
+    """Evaluate checks of one type, queue their ComplianceRecords and return the response bodies"""
+    return _run_mixed([(check_type, payload) for payload in payloads])
+
+
+def _run_check(check_type: str, payload) -> dict:
+    """Evaluate one check, queue its ComplianceRecord and return the response body"""
+    return _run_checks(check_type, [payload])[0]
+
+
+# ============================================
+# Specific Compliance Framework Checks
+# ============================================
+
+@router.post("/aml/pep", response_model=PEPCheckResponse, tags=["AML"])
+async def pep_check(payload: PEPCheckRequest):
+    """POST /compliance/aml/pep - Check if entity is a PEP (Politically Exposed Person)"""
+    return _run_check("pep", payload)
+
+
+@router.post("/gdpr/check", response_model=GDPRCheckResponse, tags=["GDPR"])
+async def gdpr_check(payload: GDPRCheckRequest):
+    """POST /compliance/gdpr/check - Verify GDPR compliance requirements"""
+    return _run_check("gdpr", payload)
+
+
+@router.post("/pci/check", response_model=PCICheckResponse, tags=["PCI-DSS"])
+async def pci_check(payload: PCICheckRequest):
+    """POST /compliance/pci/check - Verify PCI DSS compliance requirements"""
+    return _run_check("pci", payload)
+
+
+@router.post("/hipaa/check", response_model=HIPAACheckResponse, tags=["HIPAA"])
+async def hipaa_check(payload: HIPAACheckRequest):
+    """POST /compliance/hipaa/check - Verify HIPAA compliance requirements"""
+    return _run_check("hipaa", payload)
+
+
+@router.post("/iso27001/check", response_model=ISO27001Response, tags=["ISO27001"])
+async def iso_check(payload: ISO27001Request):
+    """POST /compliance/iso27001/check - Verify ISO 27001 compliance requirements"""
+    return _run_check("iso27001", payload)
+
+
+@router.post("/market/check", response_model=MarketComplianceResponse, tags=["Market Compliance"])
+async def market_check(payload: MarketComplianceRequest):
+    """POST /compliance/market/check - Verify market compliance (FINRA/MiFID)"""
+    return _run_check("market", payload)
+
+
+# ============================================
+# Batch variants: many checks of one framework per request
+# ============================================
+
+# (path, check_type, request schema, response schema, tag)
+BATCH_CHECKS = (
+    ("/aml/pep", "pep", PEPCheckRequest, PEPCheckResponse, "AML"),
+    ("/gdpr/check", "gdpr", GDPRCheckRequest, GDPRCheckResponse, "GDPR"),
+    ("/pci/check", "pci", PCICheckRequest, PCICheckResponse, "PCI-DSS"),
+    ("/hipaa/check", "hipaa", HIPAACheckRequest, HIPAACheckResponse, "HIPAA"),
+    ("/iso27001/check", "iso27001", ISO27001Request, ISO27001Response, "ISO27001"),
+    ("/market/check", "market", MarketComplianceRequest, MarketComplianceResponse, "Market Compliance"),
+)
+
+
+def _batch_endpoint(path: str, check_type: str, request_model):
+    async def endpoint(payloads: Annotated[list[request_model], Body(max_length=MAX_BATCH_CHECKS)]):
+        return _run_checks(check_type, payloads)
+    endpoint.__name__ = f"{check_type}_check_batch"
+    endpoint.__doc__ = f"POST /compliance{path}/batch - Run many {check_type} checks in one request"
+    return endpoint
+
+
+for _path, _check_type, _request_model, _response_model, _tag in BATCH_CHECKS:
+    router.add_api_route(
+        f"{_path}/batch",
+        _batch_endpoint(_path, _check_type, _request_model),
+        methods=["POST"],
+        response_model=list[_response_model],
+        tags=[_tag],
+    )
+
+
+# ============================================
+# Mixed batch: checks of several frameworks in one request
+# ============================================
+
+# check_type -> request schema
+CHECK_REQUESTS = {check_type: request_model for _, check_type, request_model, _, _ in BATCH_CHECKS}
+
+
+@router.post("/batch", response_model=BatchCheckResponse, tags=["Compliance Batch"])
+async def batch_check(batch: BatchCheckRequest):
+    """POST /compliance/batch - Run checks of any framework in one request; responses keep input order"""
+    checks = []
+    errors = []
+    for i, item in enumerate(batch.requests):
+        try:
+            checks.append((item.type, CHECK_REQUESTS[item.type].model_validate(item.payload)))
+        except ValidationError as e:
+            # Locate each error at its batch item, as FastAPI does for body fields
+            for error in e.errors(include_url=False):
+                error["loc"] = ("body", "requests", i, "payload", *error["loc"])
+                errors.append(error)
+    if errors:
+        raise HTTPException(status_code=422, detail=errors)
+    return {"responses": _run_mixed(checks)}
@@ -1,7 +1,7 @@
 from fastapi import APIRouter, HTTPException, Depends
 from sqlalchemy.orm import Session
 from app.core.database import get_db
-from app.models.doctor import Doctor, Degree, BoardCertification, Training, Employment, DisciplinaryAction, MalpracticeCase
+from app.models.doctor import Doctor, Degree, BoardCertification, Training, Employment
 from app.schemas.doctor_schema import DoctorSeedSchema
 
 router = APIRouter()
@@ -31,7 +31,15 @@ def add_doctor(data: list[DoctorSeedSchema], db: Session = Depends(get_db)):
                 name=doctor_data.name,
                 license_number=doctor_data.license_number,
                 license_status=doctor_data.license_status,
-                license_expiry=doctor_data.license_expiry
+                license_expiry=doctor_data.license_expiry,
+                disciplinary_actions=[
+                    action.model_dump() if hasattr(action, 'model_dump') else action
+                    for action in doctor_data.disciplinary_actions
+                ],
+                malpractice_cases=[
+                    case.model_dump() if hasattr(case, 'model_dump') else case
+                    for case in doctor_data.malpractice_cases
+                ]
             )
             
             # Add degree
@@ -74,18 +82,6 @@ def add_doctor(data: list[DoctorSeedSchema], db: Session = Depends(get_db)):
                 )
                 db.add(emp)
             
-            # Add disciplinary actions
-            for action in doctor_data.disciplinary_actions:
-                action_dict = action.dict() if hasattr(action, 'dict') else action
-                disc = DisciplinaryAction(data=action_dict, doctor=doctor)
-                db.add(disc)
-            
-            # Add malpractice cases
-            for case in doctor_data.malpractice_cases:
-                case_dict = case.dict() if hasattr(case, 'dict') else case
-                malpractice = MalpracticeCase(data=case_dict, doctor=doctor)
-                db.add(malpractice)
-            
             db.add(degree)
             db.add(doctor)
             LICENSE_INDEX[doctor_data.license_number] = doctor_data.doctor_id
@@ -108,7 +104,9 @@ def psv_license_status(license_number: str, db: Session = Depends(get_db)):
     if not license_number:
         raise HTTPException(status_code=400, detail='license_number parameter required')
     
-    doctor = db.query(Doctor).filter_by(license_number=license_number).first()
+    doctor = db.query(
+        Doctor.license_status, Doctor.license_expiry, Doctor.doctor_id
+    ).filter_by(license_number=license_number).first()
     
     if not doctor:
         raise HTTPException(status_code=404, detail='License not found')
@@ -127,15 +125,17 @@ def psv_degree_info(doctor_id: str, db: Session = Depends(get_db)):
     if not doctor_id:
         raise HTTPException(status_code=400, detail='doctor_id parameter required')
     
-    doctor = db.query(Doctor).filter_by(doctor_id=doctor_id).first()
+    doctor_pk = db.query(Doctor.id).filter_by(doctor_id=doctor_id).scalar()
     
-    if not doctor:
+    if doctor_pk is None:
         raise HTTPException(status_code=404, detail='Doctor not found')
     
-    if not doctor.degrees:
-        raise HTTPException(status_code=404, detail='No degree found')
+    degree = db.query(
+        Degree.degree_name, Degree.university, Degree.year_of_passing, Degree.registration_number
+    ).filter_by(doctor_id=doctor_pk).order_by(Degree.id).first()
     
-    degree = doctor.degrees[0]
+    if not degree:
+        raise HTTPException(status_code=404, detail='No degree found')
     
     return {
         'degree_name': degree.degree_name,
@@ -152,7 +152,9 @@ def psv_board_cert_info(certificate_number: str, db: Session = Depends(get_db)):
     if not certificate_number:
         raise HTTPException(status_code=400, detail='certificate_number parameter required')
     
-    cert = db.query(BoardCertification).filter_by(certificate_number=certificate_number).first()
+    cert = db.query(
+        BoardCertification.board_name, BoardCertification.valid_till
+    ).filter_by(certificate_number=certificate_number).first()
     
     if not cert:
         raise HTTPException(status_code=404, detail='Certificate not found')
@@ -170,18 +172,18 @@ def psv_training_info(doctor_id: str, db: Session = Depends(get_db)):
     if not doctor_id:
         raise HTTPException(status_code=400, detail='doctor_id parameter required')
     
-    doctor = db.query(Doctor).filter_by(doctor_id=doctor_id).first()
+    doctor_pk = db.query(Doctor.id).filter_by(doctor_id=doctor_id).scalar()
     
-    if not doctor:
+    if doctor_pk is None:
         raise HTTPException(status_code=404, detail='Doctor not found')
     
-    training_list = doctor.trainings
+    t = db.query(
+        Training.program_name, Training.institution, Training.completion_year
+    ).filter_by(doctor_id=doctor_pk).order_by(Training.id).first()
     
-    if not training_list:
+    if not t:
         return {'verified': False}
     
-    t = training_list[0]
-    
     return {
         'program_name': t.program_name,
         'institution': t.institution,
@@ -195,12 +197,16 @@ def psv_employment_info(doctor_id: str, db: Session = Depends(get_db)):
     if not doctor_id:
         raise HTTPException(status_code=400, detail='doctor_id parameter required')
     
-    doctor = db.query(Doctor).filter_by(doctor_id=doctor_id).first()
+    doctor_pk = db.query(Doctor.id).filter_by(doctor_id=doctor_id).scalar()
     
-    if not doctor:
+    if doctor_pk is None:
         raise HTTPException(status_code=404, detail='Doctor not found')
     
-    employment_details = [e.to_dict() for e in doctor.employments]
+    employment_details = [
+        row._asdict() for row in db.query(
+            Employment.employer_name, Employment.role, Employment.years
+        ).filter_by(doctor_id=doctor_pk).order_by(Employment.id)
+    ]
     
     return {
         'employment_details': employment_details,
@@ -213,12 +219,12 @@ def psv_disciplines_check(license_number: str, db: Session = Depends(get_db)):
     if not license_number:
         raise HTTPException(status_code=400, detail='license_number parameter required')
     
-    doctor = db.query(Doctor).filter_by(license_number=license_number).first()
+    doctor = db.query(Doctor.disciplinary_actions).filter_by(license_number=license_number).first()
     
     if not doctor:
         raise HTTPException(status_code=404, detail='License not found')
     
-    records = [d.to_dict() for d in doctor.disciplinary_actions]
+    records = doctor.disciplinary_actions or []
     
     return {
         'has_disciplinary_action': len(records) > 0,
@@ -231,12 +237,12 @@ def psv_malpractice_history(doctor_id: str, db: Session = Depends(get_db)):
     if not doctor_id:
         raise HTTPException(status_code=400, detail='doctor_id parameter required')
     
-    doctor = db.query(Doctor).filter_by(doctor_id=doctor_id).first()
+    doctor = db.query(Doctor.malpractice_cases).filter_by(doctor_id=doctor_id).first()
     
     if not doctor:
         raise HTTPException(status_code=404, detail='Doctor not found')
     
-    cases = [mc.to_dict() for mc in doctor.malpractice_cases]
+    cases = doctor.malpractice_cases or []
     
     return {
         'has_malpractice_history': len(cases) > 0,
@@ -244,7 +250,7 @@ def psv_malpractice_history(doctor_id: str, db: Session = Depends(get_db)):
     }
 
 @router.get('/psv/verify')
-def psv_generic_verify(type: str, value: str):
+async def psv_generic_verify(type: str, value: str):
     """Generic verification endpoint"""
     if not type or not value:
         raise HTTPException(status_code=400, detail='type and value parameters required')
@@ -442,7 +442,7 @@ def ofac_sanctions_screen(
                 match_type=match_type,
                 sanctions_details={
                     "program": match.program,
-                    "listing_date": match.listing_date.isoformat() if match.listing_date else None,
+                    "listing_date": match.listing_date,
                     "reason": match.reason
                 }
             ))
@@ -499,10 +499,7 @@ def ofac_sanctions_screen(
 # ============================================
 
 @router.post("/financial/verify", response_model=FinancialVerifyResponse, tags=["Financial Verification"])
-def verify_financial_health(
-    request: FinancialVerifyRequest,
-    db: Session = Depends(get_db)
-):
+async def verify_financial_health(request: FinancialVerifyRequest):
     """
     POST /financial/verify - Assess entity's financial health
     """
@@ -638,10 +635,7 @@ def detect_fraud(
 
 
 @router.post("/fraud/document-forgery", response_model=DocumentForgeryResponse, tags=["Fraud Detection"])
-def detect_document_forgery(
-    request: DocumentForgeryRequest,
-    db: Session = Depends(get_db)
-):
+async def detect_document_forgery(request: DocumentForgeryRequest):
     """
     POST /fraud/document-forgery - Analyze document for tampering/forgery
     """
@@ -43,7 +43,7 @@ def verify_hospital_registration(data: HospitalVerificationRequestSchema, db: Se
             'registration_number': data.registration_number,
             'hospital_name': data.hospital_name,
             'verified': is_verified,
-            'verified_at': verification.verified_at.isoformat() if is_verified else None
+            'verified_at': verification.verified_at
         }
     
     except Exception as e:
@@ -118,7 +118,7 @@ def verify_patient_identity(data: PatientVerificationRequestSchema, db: Session
             'date_of_birth': data.date_of_birth,
             'gender': data.gender,
             'verified': is_verified,
-            'verified_at': verification.verified_at.isoformat() if is_verified else None
+            'verified_at': verification.verified_at
         }
     
     except Exception as e:
@@ -1,11 +1,11 @@
-from pydantic import BaseModel
+from app.schemas.base import Schema
 from typing import List, Dict, Optional
 
 # ============================
 # ACADEMIC PROCESSING SCHEMAS
 # ============================
 
-class AcademicRecordSchema(BaseModel):
+class AcademicRecordSchema(Schema):
     level: str  # 10th, 12th, Graduation
     board: str
     roll_number: str
@@ -13,40 +13,40 @@ class AcademicRecordSchema(BaseModel):
     marks: float
     certificate_number: str
 
-class StudentSeedSchema(BaseModel):
+class StudentSeedSchema(Schema):
     student_id: str
     name: str
     dob: str
     academic_records: List[AcademicRecordSchema]
 
-class StudentResponseSchema(BaseModel):
+class StudentResponseSchema(Schema):
     message: str
     student_ids: List[str]
 
-class EligibilityRuleSchema(BaseModel):
+class EligibilityRuleSchema(Schema):
     program: str
     min_marks: float
     age_limit: Optional[int] = None
     category_specific: Optional[Dict[str, float]] = None
 
-class MeritRuleSchema(BaseModel):
+class MeritRuleSchema(Schema):
     program: str
     weightage: Dict[str, float]
 
-class EligibilityCheckSchema(BaseModel):
+class EligibilityCheckSchema(Schema):
     eligible: bool
     program: str
     student_marks: float
     required_marks: float
     message: str
 
-class MeritCalculationSchema(BaseModel):
+class MeritCalculationSchema(Schema):
     student_id: str
     program: str
     merit_score: float
     rank: Optional[int] = None
 
-class RollNumberLookupSchema(BaseModel):
+class RollNumberLookupSchema(Schema):
     student_id: str
     roll_number: str
     year_of_passing: str
@@ -0,0 +1,7 @@
+"""Shared base class for request/response schemas"""
+from pydantic import BaseModel, ConfigDict
+
+
+class Schema(BaseModel):
+    """Base schema; the pydantic-core validator is built on first use, not at import"""
+    model_config = ConfigDict(defer_build=True)
@@ -2,11 +2,15 @@
 Legacy Compliance Check Schemas
 Schemas for specific compliance framework checks (GDPR, PCI, HIPAA, ISO27001, Market)
 """
-from pydantic import BaseModel
-from typing import List, Optional
+from pydantic import Field
+from app.schemas.base import Schema
+from typing import Any, Dict, List, Literal, Optional
 
+# Most checks accepted in one batch request (one BatchWriter flush)
+MAX_BATCH_CHECKS = 200
 
-class APIResponse(BaseModel):
+
+class APIResponse(Schema):
     """Base API response with common fields"""
     request_id: str
     status: str
@@ -17,7 +21,7 @@ class APIResponse(BaseModel):
 # PEP Check Schemas
 # ============================================
 
-class PEPCheckRequest(BaseModel):
+class PEPCheckRequest(Schema):
     name: str
     country: str
 
@@ -32,7 +36,7 @@ class PEPCheckResponse(APIResponse):
 # GDPR Check Schemas
 # ============================================
 
-class GDPRCheckRequest(BaseModel):
+class GDPRCheckRequest(Schema):
     has_privacy_policy: bool
     consent_mechanism: bool
     data_retention_policy: bool
@@ -47,7 +51,7 @@ class GDPRCheckResponse(APIResponse):
 # PCI-DSS Check Schemas
 # ============================================
 
-class PCICheckRequest(BaseModel):
+class PCICheckRequest(Schema):
     stores_card_data: bool
     encryption_enabled: bool
     access_control: bool
@@ -62,7 +66,7 @@ class PCICheckResponse(APIResponse):
 # HIPAA Check Schemas
 # ============================================
 
-class HIPAACheckRequest(BaseModel):
+class HIPAACheckRequest(Schema):
     handles_phi: bool
     access_logging: bool
     breach_policy: bool
@@ -77,7 +81,7 @@ class HIPAACheckResponse(APIResponse):
 # ISO 27001 Check Schemas
 # ============================================
 
-class ISO27001Request(BaseModel):
+class ISO27001Request(Schema):
     risk_assessment_done: bool
     incident_management: bool
     access_control_policy: bool
@@ -92,7 +96,7 @@ class ISO27001Response(APIResponse):
 # Market Compliance Check Schemas
 # ============================================
 
-class MarketComplianceRequest(BaseModel):
+class MarketComplianceRequest(Schema):
     trade_monitoring: bool
     conflict_policy: bool
 
@@ -100,3 +104,20 @@ class MarketComplianceRequest(BaseModel):
 class MarketComplianceResponse(APIResponse):
     compliant: bool
     remarks: List[str]
+
+
+# ============================================
+# Mixed Batch Schemas
+# ============================================
+
+class BatchCheckItem(Schema):
+    type: Literal["pep", "gdpr", "pci", "hipaa", "iso27001", "market"]
+    payload: Dict[str, Any]
+
+
+class BatchCheckRequest(Schema):
+    requests: List[BatchCheckItem] = Field(max_length=MAX_BATCH_CHECKS)
+
+
+class BatchCheckResponse(Schema):
+    responses: List[Dict[str, Any]]
@@ -1,37 +1,38 @@
-from pydantic import BaseModel
+from datetime import date
+from app.schemas.base import Schema
 from typing import List, Dict, Optional, Any
 
 # ============================
 # DOCTOR ONBOARDING SCHEMAS
 # ============================
 
-class DegreeSchema(BaseModel):
+class DegreeSchema(Schema):
     degree_name: str
     university: str
     year_of_passing: str
     registration_number: str
 
-class BoardCertSchema(BaseModel):
+class BoardCertSchema(Schema):
     board_name: str
     certificate_number: str
-    valid_till: str
+    valid_till: date
 
-class TrainingSchema(BaseModel):
+class TrainingSchema(Schema):
     program_name: str
     institution: str
     completion_year: str
 
-class EmploymentSchema(BaseModel):
+class EmploymentSchema(Schema):
     employer_name: str
     role: str
     years: str
 
-class DoctorSeedSchema(BaseModel):
+class DoctorSeedSchema(Schema):
     doctor_id: str
     name: str
     license_number: str
     license_status: str
-    license_expiry: str
+    license_expiry: date
     degree: DegreeSchema
     board_certifications: List[BoardCertSchema]
     training: List[TrainingSchema]
@@ -39,18 +40,18 @@ class DoctorSeedSchema(BaseModel):
     disciplinary_actions: List[Any] = []
     malpractice_cases: List[Any] = []
 
-class DoctorResponseSchema(BaseModel):
+class DoctorResponseSchema(Schema):
     message: str
     doctor_ids: List[str]
 
-class LicenseStatusSchema(BaseModel):
+class LicenseStatusSchema(Schema):
     license_number: str
     status: str
-    expiry_date: str
+    expiry_date: Optional[date]
     issuer: str
     doctor_id: str
 
-class DegreeInfoSchema(BaseModel):
+class DegreeInfoSchema(Schema):
     degree_name: str
     university: str
     year_of_passing: str
@@ -58,31 +59,31 @@ class DegreeInfoSchema(BaseModel):
     verified: bool
     source_authority: str
 
-class BoardCertInfoSchema(BaseModel):
+class BoardCertInfoSchema(Schema):
     board_name: str
     certificate_number: str
-    valid_till: str
+    valid_till: Optional[date]
     verified: bool
 
-class TrainingInfoSchema(BaseModel):
+class TrainingInfoSchema(Schema):
     program_name: Optional[str] = None
     institution: Optional[str] = None
     completion_year: Optional[str] = None
     verified: bool
 
-class EmploymentInfoSchema(BaseModel):
+class EmploymentInfoSchema(Schema):
     employment_details: List[dict]
     verified: bool
 
-class DisciplinaryCheckSchema(BaseModel):
+class DisciplinaryCheckSchema(Schema):
     has_disciplinary_action: bool
     records: List[dict]
 
-class MalpracticeHistorySchema(BaseModel):
+class MalpracticeHistorySchema(Schema):
     has_malpractice_history: bool
     cases: List[dict]
 
-class GenericVerifySchema(BaseModel):
+class GenericVerifySchema(Schema):
     verified: bool
     confidence: float
     type: str
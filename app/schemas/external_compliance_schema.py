@@ -2,7 +2,8 @@
 External Compliance & Verification API Schemas
 Comprehensive schemas for regulations, sanctions, financial verification, and fraud detection
 """
-from pydantic import BaseModel, Field
+from pydantic import Field
+from app.schemas.base import Schema
 from typing import List, Optional, Dict, Any
 from datetime import datetime, date
 
@@ -11,18 +12,18 @@ from datetime import datetime, date
 # Base Response Models
 # ============================================
 
-class ErrorDetail(BaseModel):
+class ErrorDetail(Schema):
     field: str
     message: str
 
 
-class ErrorResponse(BaseModel):
+class ErrorResponse(Schema):
     code: str
     message: str
     details: Optional[List[ErrorDetail]] = None
 
 
-class BaseAPIResponse(BaseModel):
+class BaseAPIResponse(Schema):
     success: bool = True
 
 
@@ -30,14 +31,14 @@ class BaseAPIResponse(BaseModel):
 # Regulation Schemas
 # ============================================
 
-class KeyArticle(BaseModel):
+class KeyArticle(Schema):
     article_id: str
     title: str
     content: str
     penalties: Optional[str] = None
 
 
-class RegulationCreateRequest(BaseModel):
+class RegulationCreateRequest(Schema):
     """Schema for creating a new regulation"""
     regulation_id: str = Field(..., example="REG-GDPR-001")
     name: str = Field(..., example="General Data Protection Regulation")
@@ -55,7 +56,7 @@ class RegulationCreateRequest(BaseModel):
     tags: Optional[List[str]] = None
 
 
-class RegulationUpdateRequest(BaseModel):
+class RegulationUpdateRequest(Schema):
     """Schema for updating a regulation (partial update)"""
     name: Optional[str] = None
     code: Optional[str] = None
@@ -72,7 +73,7 @@ class RegulationUpdateRequest(BaseModel):
     tags: Optional[List[str]] = None
 
 
-class RegulationResponse(BaseModel):
+class RegulationResponse(Schema):
     """Full regulation response"""
     regulation_id: str
     name: str
@@ -92,7 +93,7 @@ class RegulationResponse(BaseModel):
     updated_at: Optional[datetime]
 
 
-class RegulationSummary(BaseModel):
+class RegulationSummary(Schema):
     """Regulation summary for list view"""
     regulation_id: str
     name: str
@@ -117,7 +118,7 @@ class RegulationListResponse(BaseAPIResponse):
 # Compliance Verification Schemas
 # ============================================
 
-class ComplianceVerifyEntityRequest(BaseModel):
+class ComplianceVerifyEntityRequest(Schema):
     """Request to verify entity compliance"""
     entity_name: str = Field(..., example="Acme Corp")
     entity_type: str = Field(..., example="company")
@@ -127,14 +128,14 @@ class ComplianceVerifyEntityRequest(BaseModel):
     document_data: Optional[Dict[str, Any]] = None
 
 
-class Violation(BaseModel):
+class Violation(Schema):
     regulation: str
     article: Optional[str]
     description: str
     severity: str  # low, medium, high, critical
 
 
-class ComplianceVerifyEntityResponse(BaseModel):
+class ComplianceVerifyEntityResponse(Schema):
     """Response from compliance verification"""
     compliance_status: str  # compliant, partial, non_compliant
     compliance_score: int = Field(..., ge=0, le=100)
@@ -151,7 +152,7 @@ class ComplianceVerifyEntityResponse(BaseModel):
 # Sanctions Screening Schemas
 # ============================================
 
-class SanctionsScreenRequest(BaseModel):
+class SanctionsScreenRequest(Schema):
     """Request for OFAC/Sanctions screening"""
     entity_name: str = Field(..., example="Acme Corp")
     entity_type: str = Field(..., example="company")
@@ -164,7 +165,7 @@ class SanctionsScreenRequest(BaseModel):
     )
 
 
-class SanctionsMatch(BaseModel):
+class SanctionsMatch(Schema):
     list_name: str
     match_score: int
     matched_name: str
@@ -172,18 +173,18 @@ class SanctionsMatch(BaseModel):
     sanctions_details: Optional[Dict[str, Any]] = None
 
 
-class PEPCheck(BaseModel):
+class PEPCheck(Schema):
     is_pep: bool
     pep_level: Optional[str] = None
     details: Optional[str] = None
 
 
-class AdverseMedia(BaseModel):
+class AdverseMedia(Schema):
     found: bool
     articles: List[Dict[str, Any]]
 
 
-class SanctionsScreenResponse(BaseModel):
+class SanctionsScreenResponse(Schema):
     """Response from sanctions screening"""
     screening_status: str  # clear, hit, potential_match
     matches_found: int
@@ -199,7 +200,7 @@ class SanctionsScreenResponse(BaseModel):
 # Financial Verification Schemas
 # ============================================
 
-class FinancialVerifyRequest(BaseModel):
+class FinancialVerifyRequest(Schema):
     """Request for financial health verification"""
     entity_name: str = Field(..., example="Acme Corp")
     entity_country: str = Field(..., example="US")
@@ -211,29 +212,29 @@ class FinancialVerifyRequest(BaseModel):
     check_liens: bool = True
 
 
-class CreditDetails(BaseModel):
+class CreditDetails(Schema):
     score: Optional[int] = None
     payment_history: Optional[str] = None
     credit_utilization: Optional[str] = None
 
 
-class FinancialIndicators(BaseModel):
+class FinancialIndicators(Schema):
     revenue_trend: Optional[str] = None
     profit_margin: Optional[str] = None
     debt_to_equity: Optional[float] = None
 
 
-class BankruptcyHistory(BaseModel):
+class BankruptcyHistory(Schema):
     has_history: bool
     filings: List[Dict[str, Any]]
 
 
-class LiensInfo(BaseModel):
+class LiensInfo(Schema):
     active_liens: int
     total_amount: float
 
 
-class FinancialVerifyResponse(BaseModel):
+class FinancialVerifyResponse(Schema):
     """Response from financial verification"""
     financial_health_score: int
     risk_level: str
@@ -252,30 +253,30 @@ class FinancialVerifyResponse(BaseModel):
 # Fraud Detection Schemas
 # ============================================
 
-class FraudDetectRequest(BaseModel):
+class FraudDetectRequest(Schema):
     """Request for fraud detection"""
     entity_name: str = Field(..., example="Acme Corp")
     entity_type: str = Field(..., example="company")
     document_data: Optional[Dict[str, Any]] = None
 
 
-class FraudIndicator(BaseModel):
+class FraudIndicator(Schema):
     type: str
     confidence: int
     description: str
 
 
-class IdentityVerification(BaseModel):
+class IdentityVerification(Schema):
     verified: bool
     confidence: int
 
 
-class AddressVerification(BaseModel):
+class AddressVerification(Schema):
     valid: bool
     type: Optional[str] = None  # commercial, residential, virtual
 
 
-class FraudDetectResponse(BaseModel):
+class FraudDetectResponse(Schema):
     """Response from fraud detection"""
     fraud_detected: bool
     risk_level: str
@@ -287,21 +288,21 @@ class FraudDetectResponse(BaseModel):
     analyzed_at: datetime
 
 
-class DocumentForgeryRequest(BaseModel):
+class DocumentForgeryRequest(Schema):
     """Request for document forgery detection"""
     document_type: str = Field(..., example="business_license")
     document_data: Dict[str, Any]
     metadata: Optional[Dict[str, Any]] = None
 
 
-class AuthenticityChecks(BaseModel):
+class AuthenticityChecks(Schema):
     format_valid: bool
     dates_consistent: bool
     authority_verified: bool
     metadata_clean: bool
 
 
-class DocumentForgeryResponse(BaseModel):
+class DocumentForgeryResponse(Schema):
     """Response from document forgery detection"""
     forgery_detected: bool
     confidence_score: int
@@ -315,17 +316,17 @@ class DocumentForgeryResponse(BaseModel):
 # Sanctions List Management Schemas
 # ============================================
 
-class SanctionsEntryIdentifier(BaseModel):
+class SanctionsEntryIdentifier(Schema):
     type: str
     value: str
 
 
-class SanctionsEntryAdditionalInfo(BaseModel):
+class SanctionsEntryAdditionalInfo(Schema):
     addresses: Optional[List[str]] = None
     identifiers: Optional[List[SanctionsEntryIdentifier]] = None
 
 
-class SanctionsEntryCreateRequest(BaseModel):
+class SanctionsEntryCreateRequest(Schema):
     """Request to add entry to sanctions list"""
     entry_id: str = Field(..., example="SDN-12345")
     name: str = Field(..., example="ACME EVIL CORP")
@@ -339,7 +340,7 @@ class SanctionsEntryCreateRequest(BaseModel):
     is_active: bool = True
 
 
-class SanctionsEntryResponse(BaseModel):
+class SanctionsEntryResponse(Schema):
     """Response for sanctions entry"""
     entry_id: str
     list_type: str
@@ -373,13 +374,13 @@ class SanctionsListEntriesResponse(BaseAPIResponse):
 # Fraud Patterns Schemas
 # ============================================
 
-class FraudPatternIndicator(BaseModel):
+class FraudPatternIndicator(Schema):
     field: str
     condition: str
     weight: float
 
 
-class FraudPatternCreateRequest(BaseModel):
+class FraudPatternCreateRequest(Schema):
     """Request to create fraud pattern"""
     pattern_id: str = Field(..., example="FP-001")
     name: str = Field(..., example="Synthetic Identity Pattern")
@@ -391,7 +392,7 @@ class FraudPatternCreateRequest(BaseModel):
     is_active: bool = True
 
 
-class FraudPatternUpdateRequest(BaseModel):
+class FraudPatternUpdateRequest(Schema):
     """Request to update fraud pattern"""
     name: Optional[str] = None
     category: Optional[str] = None
@@ -402,7 +403,7 @@ class FraudPatternUpdateRequest(BaseModel):
     is_active: Optional[bool] = None
 
 
-class FraudPatternResponse(BaseModel):
+class FraudPatternResponse(Schema):
     """Response for fraud pattern"""
     pattern_id: str
     name: str
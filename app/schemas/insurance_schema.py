@@ -1,4 +1,4 @@
-from pydantic import BaseModel
+from app.schemas.base import Schema
 from typing import Dict, Any, Optional
 from decimal import Decimal
 
@@ -6,43 +6,43 @@ from decimal import Decimal
 # INSURANCE CLAIM SCHEMAS
 # ============================
 
-class MedicalEnrichmentRequestSchema(BaseModel):
+class MedicalEnrichmentRequestSchema(Schema):
     diagnosis: str
     hospital_name: str
 
-class MedicalEnrichmentResponseSchema(BaseModel):
+class MedicalEnrichmentResponseSchema(Schema):
     id: int
     diagnosis: str
     hospital_name: str
     icd_mapping: Optional[Dict[str, str]] = None
     message: str
 
-class ReviewerRequestSchema(BaseModel):
+class ReviewerRequestSchema(Schema):
     workflow_state: Dict[str, Any]
 
-class ReviewerRequestResponseSchema(BaseModel):
+class ReviewerRequestResponseSchema(Schema):
     id: int
     workflow_state: Dict[str, Any]
     message: str
 
-class PayoutRequestSchema(BaseModel):
+class PayoutRequestSchema(Schema):
     approved_amount: float
     deductible: float
     policy_limit: float
 
-class PayoutRequestResponseSchema(BaseModel):
+class PayoutRequestResponseSchema(Schema):
     id: int
     approved_amount: float
     deductible: float
     policy_limit: float
     message: str
 
-class NotificationRequestSchema(BaseModel):
+class NotificationRequestSchema(Schema):
     recipient_email: str
     subject: str
     message: str
 
-class NotificationResponseSchema(BaseModel):
+class NotificationResponseSchema(Schema):
     id: int
     recipient_email: str
     subject: str
@@ -54,12 +54,12 @@ class NotificationResponseSchema(BaseModel):
 # HOSPITAL VERIFICATION SCHEMAS
 # ============================
 
-class HospitalVerificationRequestSchema(BaseModel):
+class HospitalVerificationRequestSchema(Schema):
     registration_number: str
     hospital_name: str
 
 
-class HospitalVerificationResponseSchema(BaseModel):
+class HospitalVerificationResponseSchema(Schema):
     registration_number: str
     hospital_name: str
     verified: bool
@@ -70,7 +70,7 @@ class HospitalVerificationResponseSchema(BaseModel):
 # PATIENT VERIFICATION SCHEMAS
 # ============================
 
-class PatientVerificationRequestSchema(BaseModel):
+class PatientVerificationRequestSchema(Schema):
     patient_id: str
     aadhar_last4: str
     full_name: str
@@ -78,7 +78,7 @@ class PatientVerificationRequestSchema(BaseModel):
     gender: str
 
 
-class PatientVerificationResponseSchema(BaseModel):
+class PatientVerificationResponseSchema(Schema):
     patient_id: str
     aadhar_last4: str
     full_name: str
@@ -88,7 +88,7 @@ class PatientVerificationResponseSchema(BaseModel):
     verified_at: Optional[str] = None
     response_message: str
 
-class MedicalDataEnrichmentSchema(BaseModel):
+class MedicalDataEnrichmentSchema(Schema):
     diagnosis: str
     icd_code: str
     description: str
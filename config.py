@@ -13,6 +13,18 @@ class Settings:
     # Disable SQLAlchemy echo by default to avoid verbose SQL logs
     SQLALCHEMY_ECHO: bool = False
     LOG_LEVEL: str = os.getenv('LOG_LEVEL', 'INFO')
+    # Connection pool sizing; DB_NULL_POOL opens a fresh connection per checkout
+    # (for CLIs and tests that should not hold idle connections)
+    DB_POOL_SIZE: int = int(os.getenv('DB_POOL_SIZE', 5))
+    DB_MAX_OVERFLOW: int = int(os.getenv('DB_MAX_OVERFLOW', 10))
+    DB_POOL_RECYCLE: int = int(os.getenv('DB_POOL_RECYCLE', 1800))
+    DB_NULL_POOL: bool = os.getenv('DB_NULL_POOL', 'false').lower() == 'true'
+    # Serve /openapi.json, /docs and /redoc
+    ENABLE_DOCS: bool = os.getenv('ENABLE_DOCS', 'true').lower() == 'true'
+    # Create missing tables on startup; production relies on Alembic migrations
+    AUTO_CREATE_TABLES: bool = os.getenv('AUTO_CREATE_TABLES', 'true').lower() == 'true'
+    # Shared cache for lookup indexes (e.g. redis://localhost:6379/0); empty keeps them in-process
+    REDIS_URL: str = os.getenv('REDIS_URL', '')
 
 class DevelopmentConfig(Settings):
     """Development configuration"""
@@ -25,12 +37,15 @@ class ProductionConfig(Settings):
     DEBUG: bool = False
     APP_ENV: str = "production"
     DATABASE_URL: str = os.getenv('DATABASE_URL')
+    AUTO_CREATE_TABLES: bool = os.getenv('AUTO_CREATE_TABLES', 'false').lower() == 'true'
+    ENABLE_DOCS: bool = os.getenv('ENABLE_DOCS', 'false').lower() == 'true'
 
 class TestingConfig(Settings):
     """Testing configuration"""
     DEBUG: bool = True
     APP_ENV: str = "testing"
     DATABASE_URL: str = 'sqlite:///./test.db'
+    DB_NULL_POOL: bool = True
 
 # Create config mapping (map names to classes)
 config = {
@@ -41,11 +56,14 @@ config = {
 }
 
 
-def get_config(config_name: str = 'development') -> Settings:
+def get_config(config_name: str = None) -> Settings:
     """Get configuration instance for the given name.
 
+    Defaults to the APP_ENV environment variable, then 'development'.
     Returns an instantiated `Settings` subclass so callers can access
     attributes as `settings.API_TITLE`.
     """
+    if config_name is None:
+        config_name = os.getenv('APP_ENV', 'development')
     cfg_class = config.get(config_name, config['default'])
     return cfg_class()
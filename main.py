@@ -6,7 +6,6 @@ Usage examples:
 """
 import os
 import logging
-from contextlib import asynccontextmanager
 from app.core.app import create_app
 
 # Suppress Uvicorn banner on startup
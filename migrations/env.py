@@ -27,8 +27,9 @@ project_root = Path(__file__).resolve().parents[1]
 sys.path.insert(0, str(project_root))
  
 from app.core.database import Base
-# Import models package so all model modules are loaded and registered with Base.metadata
-import app.models  # noqa: F401
+# Load all model modules so every table is registered with Base.metadata
+from app.models import load_all_models
+load_all_models()
  
 target_metadata = Base.metadata
  
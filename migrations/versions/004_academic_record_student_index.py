@@ -0,0 +1,23 @@
+"""Index academic_records.student_id
+
+Revision ID: 004_academic_record_student_index
+Revises: 003_external_compliance
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '004_academic_record_student_index'
+down_revision = '003_external_compliance'
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    op.create_index(op.f('ix_academic_records_student_id'), 'academic_records', ['student_id'])
+
+
+def downgrade():
+    op.drop_index(op.f('ix_academic_records_student_id'), table_name='academic_records')
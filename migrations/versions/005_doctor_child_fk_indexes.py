@@ -0,0 +1,34 @@
+"""Index doctor_id on doctor child tables
+
+Revision ID: 005_doctor_child_fk_indexes
+Revises: 004_academic_record_student_index
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision = '005_doctor_child_fk_indexes'
+down_revision = '004_academic_record_student_index'
+branch_labels = None
+depends_on = None
+
+CHILD_TABLES = (
+    'degrees',
+    'board_certifications',
+    'trainings',
+    'employments',
+    'disciplinary_actions',
+    'malpractice_cases',
+)
+
+
+def upgrade():
+    for table in CHILD_TABLES:
+        op.create_index(op.f(f'ix_{table}_doctor_id'), table, ['doctor_id'])
+
+
+def downgrade():
+    for table in CHILD_TABLES:
+        op.drop_index(op.f(f'ix_{table}_doctor_id'), table_name=table)
@@ -0,0 +1,51 @@
+"""Store disciplinary actions and malpractice cases inline on doctors
+
+Revision ID: 006_doctor_inline_records
+Revises: 005_doctor_child_fk_indexes
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '006_doctor_inline_records'
+down_revision = '005_doctor_child_fk_indexes'
+branch_labels = None
+depends_on = None
+
+INLINE_TABLES = ('disciplinary_actions', 'malpractice_cases')
+
+
+def upgrade():
+    for table in INLINE_TABLES:
+        op.add_column(
+            'doctors',
+            sa.Column(table, sa.JSON(), nullable=False, server_default=sa.text("'[]'")),
+        )
+        op.execute(
+            f"UPDATE doctors SET {table} = sub.records "
+            f"FROM (SELECT doctor_id, json_agg(data ORDER BY id) AS records "
+            f"FROM {table} GROUP BY doctor_id) sub "
+            f"WHERE sub.doctor_id = doctors.id"
+        )
+        op.drop_table(table)
+
+
+def downgrade():
+    for table in INLINE_TABLES:
+        op.create_table(
+            table,
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('doctor_id', sa.Integer(), nullable=False),
+            sa.Column('data', sa.JSON(), nullable=False),
+            sa.ForeignKeyConstraint(['doctor_id'], ['doctors.id'], ),
+            sa.PrimaryKeyConstraint('id')
+        )
+        op.create_index(op.f(f'ix_{table}_doctor_id'), table, ['doctor_id'])
+        op.execute(
+            f"INSERT INTO {table} (doctor_id, data) "
+            f"SELECT id, json_array_elements({table}) FROM doctors"
+        )
+        op.drop_column('doctors', table)
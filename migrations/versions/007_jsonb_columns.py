@@ -0,0 +1,49 @@
+"""Convert doctor and insurance JSON columns to JSONB
+
+Revision ID: 007_jsonb_columns
+Revises: 006_doctor_inline_records
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision = '007_jsonb_columns'
+down_revision = '006_doctor_inline_records'
+branch_labels = None
+depends_on = None
+
+# (table, column, nullable, server default)
+JSONB_COLUMNS = (
+    ('doctors', 'disciplinary_actions', False, "'[]'"),
+    ('doctors', 'malpractice_cases', False, "'[]'"),
+    ('medical_enrichment_requests', 'icd_mapping', True, None),
+    ('reviewer_requests', 'workflow_state', False, None),
+)
+
+
+def _convert(target, cast):
+    for table, column, nullable, default in JSONB_COLUMNS:
+        # The default has to be dropped while the column type changes
+        if default is not None:
+            op.alter_column(table, column, server_default=None)
+        op.alter_column(
+            table,
+            column,
+            type_=target,
+            existing_nullable=nullable,
+            postgresql_using=f'{column}::{cast}',
+        )
+        if default is not None:
+            op.alter_column(table, column, server_default=sa.text(default))
+
+
+def upgrade():
+    _convert(postgresql.JSONB(), 'jsonb')
+
+
+def downgrade():
+    _convert(sa.JSON(), 'json')
@@ -0,0 +1,63 @@
+"""Store license_expiry and valid_till as DATE
+
+Revision ID: 008_doctor_date_columns
+Revises: 007_jsonb_columns
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '008_doctor_date_columns'
+down_revision = '007_jsonb_columns'
+branch_labels = None
+depends_on = None
+
+
+# ISO values cast directly, DD-MM-YYYY / DD/MM/YYYY are reparsed, and
+# anything else (or an impossible date such as 2024-02-30) becomes NULL
+# instead of aborting the migration
+TRY_DATE = r"""
+CREATE FUNCTION pg_temp.try_date(value text) RETURNS date AS $$
+BEGIN
+    RETURN CASE
+        WHEN value ~ '^\d{4}-\d{2}-\d{2}$' THEN value::date
+        WHEN value ~ '^\d{1,2}[/-]\d{1,2}[/-]\d{4}$' THEN to_date(replace(value, '/', '-'), 'DD-MM-YYYY')
+    END;
+EXCEPTION WHEN others THEN
+    RETURN NULL;
+END
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade():
+    op.execute(TRY_DATE)
+    # Legacy values that cannot be parsed are stored as NULL
+    op.alter_column(
+        'doctors', 'license_expiry',
+        type_=sa.Date(), nullable=True, existing_nullable=False,
+        postgresql_using='pg_temp.try_date(license_expiry)',
+    )
+    op.alter_column(
+        'board_certifications', 'valid_till',
+        type_=sa.Date(), nullable=True, existing_nullable=False,
+        postgresql_using='pg_temp.try_date(valid_till)',
+    )
+    op.create_index(op.f('ix_doctors_license_expiry'), 'doctors', ['license_expiry'])
+
+
+def downgrade():
+    op.drop_index(op.f('ix_doctors_license_expiry'), table_name='doctors')
+    op.alter_column(
+        'board_certifications', 'valid_till',
+        type_=sa.String(50), nullable=False, existing_nullable=True,
+        postgresql_using="COALESCE(valid_till::text, '')",
+    )
+    op.alter_column(
+        'doctors', 'license_expiry',
+        type_=sa.String(50), nullable=False, existing_nullable=True,
+        postgresql_using="COALESCE(license_expiry::text, '')",
+    )
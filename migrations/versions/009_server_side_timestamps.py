@@ -0,0 +1,55 @@
+"""Database-side defaults for created_at/updated_at
+
+Revision ID: 009_server_side_timestamps
+Revises: 008_doctor_date_columns
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '009_server_side_timestamps'
+down_revision = '008_doctor_date_columns'
+branch_labels = None
+depends_on = None
+
+UTC_NOW = sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+
+# table -> timestamp columns
+TIMESTAMP_COLUMNS = {
+    'doctors': ('created_at', 'updated_at'),
+    'student_seeds': ('created_at', 'updated_at'),
+    'eligibility_rules': ('created_at', 'updated_at'),
+    'merit_rules': ('created_at', 'updated_at'),
+    'medical_enrichment_requests': ('created_at', 'updated_at'),
+    'reviewer_requests': ('created_at', 'updated_at'),
+    'payout_requests': ('created_at', 'updated_at'),
+    'notification_requests': ('created_at', 'updated_at'),
+    'hospital_verifications': ('created_at', 'updated_at'),
+    'patient_verifications': ('created_at', 'updated_at'),
+    'compliance_records': ('created_at',),
+    'regulations': ('created_at', 'updated_at'),
+    'sanctions_entries': ('created_at', 'updated_at'),
+    'fraud_patterns': ('created_at', 'updated_at'),
+}
+
+
+def _set_defaults(default):
+    # hospital/patient verification tables may only exist where they were
+    # created by init_db, so skip any table that is not there
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+    for table, columns in TIMESTAMP_COLUMNS.items():
+        if table not in existing:
+            continue
+        for column in columns:
+            op.alter_column(table, column, server_default=default, existing_type=sa.DateTime())
+
+
+def upgrade():
+    _set_defaults(UTC_NOW)
+
+
+def downgrade():
+    _set_defaults(None)
@@ -0,0 +1,59 @@
+"""Create hospital_verifications and patient_verifications
+
+Revision ID: 010_insurance_verification_tables
+Revises: 009_server_side_timestamps
+Create Date: 2026-10-15 00:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision = '010_insurance_verification_tables'
+down_revision = '009_server_side_timestamps'
+branch_labels = None
+depends_on = None
+
+UTC_NOW = sa.text("TIMEZONE('utc', CURRENT_TIMESTAMP)")
+
+
+def upgrade():
+    # Databases bootstrapped with init_db may already have these tables
+    existing = set(sa.inspect(op.get_bind()).get_table_names())
+
+    if 'hospital_verifications' not in existing:
+        op.create_table(
+            'hospital_verifications',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('registration_number', sa.String(255), nullable=False),
+            sa.Column('hospital_name', sa.String(255), nullable=False),
+            sa.Column('verified', sa.Boolean(), nullable=True),
+            sa.Column('verified_at', sa.DateTime(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), server_default=UTC_NOW, nullable=True),
+            sa.Column('updated_at', sa.DateTime(), server_default=UTC_NOW, nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('registration_number')
+        )
+
+    if 'patient_verifications' not in existing:
+        op.create_table(
+            'patient_verifications',
+            sa.Column('id', sa.Integer(), nullable=False),
+            sa.Column('patient_id', sa.String(255), nullable=False),
+            sa.Column('aadhar_last4', sa.String(4), nullable=False),
+            sa.Column('full_name', sa.String(255), nullable=False),
+            sa.Column('date_of_birth', sa.String(10), nullable=False),
+            sa.Column('gender', sa.String(10), nullable=False),
+            sa.Column('verified', sa.Boolean(), nullable=True),
+            sa.Column('verified_at', sa.DateTime(), nullable=True),
+            sa.Column('created_at', sa.DateTime(), server_default=UTC_NOW, nullable=True),
+            sa.Column('updated_at', sa.DateTime(), server_default=UTC_NOW, nullable=True),
+            sa.PrimaryKeyConstraint('id'),
+            sa.UniqueConstraint('patient_id')
+        )
+
+
+def downgrade():
+    op.drop_table('patient_verifications')
+    op.drop_table('hospital_verifications')